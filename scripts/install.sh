@@ -24,7 +24,7 @@ pip install -e .
 echo "✅ Installation completed successfully!"
 
 # Initialize configuration if it doesn't exist
-if [ ! -f "$HOME/.claude/claude-profiles.yml" ]; then
+if [ ! -f "$HOME/.claude/claude-profiles.json" ] && [ ! -f "$HOME/.claude/claude-profiles.yml" ]; then
     echo "Initializing configuration..."
     claude-env-manager init
 fi
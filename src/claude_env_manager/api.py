@@ -1,12 +1,15 @@
 """Core API classes for Claude Code Environment Manager."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
 
-# Third-party imports
-import yaml
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 # Local imports
 from .exceptions import (
@@ -16,9 +19,60 @@ from .exceptions import (
     SettingsFileError,
 )
 from .models import ClaudeSettings, EnvironmentProfile, ProfileConfig
-from .utils.io import create_backup, safe_read_file, safe_write_file
+from .utils.config import get_claude_config_dir
+from .utils.io import create_backup, safe_write_file
 from .utils.validation import validate_environment_vars, validate_profile_name
 
+# Config files with these suffixes are read and written as YAML, others as JSON
+_YAML_SUFFIXES = (".yml", ".yaml")
+
+# Variables with this prefix are managed by profiles
+_ANTHROPIC_PREFIX = "ANTHROPIC_"
+
+
+def _load_yaml(stream: BinaryIO) -> Any:
+    """Parse YAML, preferring the libyaml-backed C loader when available."""
+    # Imported lazily so JSON configs never pay the PyYAML import cost
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def _load_json(stream: BinaryIO) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(stream.read())
+    return json.load(stream)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Encode data as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _read_parsed(path: Path, parse: Callable[[BinaryIO], Any]) -> Any:
+    """Parse a file straight from its binary handle.
+
+    The file is opened once and stat'ed through the open descriptor, so a
+    missing file surfaces as FileNotFoundError without a separate exists()
+    check. Empty files parse to None.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return None
+        return parse(f)
+
+
+def _matches_file(path: Path, data: bytes) -> bool:
+    """Check whether a file already holds exactly ``data``."""
+    try:
+        return path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
 
 class ClaudeEnvManager:
     """Main API for managing Claude Code environment configurations."""
@@ -36,32 +90,55 @@ class ClaudeEnvManager:
 
     def _get_default_config_path(self) -> Path:
         """Get default configuration file path."""
-        home = Path.home()
-        return home / ".claude" / "claude-profiles.yml"
+        return get_claude_config_dir() / "claude-profiles.json"
 
     def _get_default_settings_path(self) -> Path:
         """Get default Claude Code settings file path."""
-        home = Path.home()
-        return home / ".claude" / "settings.json"
+        return get_claude_config_dir() / "settings.json"
+
+    def _get_legacy_config_path(self) -> Optional[Path]:
+        """Get the YAML config path that a JSON config may be migrated from."""
+        if self.config_file.suffix in _YAML_SUFFIXES:
+            return None
+        return self.config_file.with_suffix(".yml")
+
+    def _read_config_dict(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Read and parse a config file, choosing the format by suffix."""
+        if path.suffix in _YAML_SUFFIXES:
+            import yaml
+
+            try:
+                return _read_parsed(path, _load_yaml)
+            except yaml.YAMLError as e:
+                raise ConfigurationError(f"Invalid YAML format in {path}: {e}")
+        return _read_parsed(path, _load_json)
+
+    def _load_legacy_config(self) -> Optional[ProfileConfig]:
+        """Load the legacy YAML config, if any, so it can be migrated to JSON."""
+        legacy_file = self._get_legacy_config_path()
+        if legacy_file is None:
+            return None
+
+        try:
+            config_dict = self._read_config_dict(legacy_file)
+        except FileNotFoundError:
+            return None
+
+        return ProfileConfig.from_dict(config_dict) if config_dict else ProfileConfig()
 
     def load_config(self) -> ProfileConfig:
-        """Load configuration from YAML file."""
+        """Load configuration from JSON (or YAML) file."""
         if self._config_cache:
             return self._config_cache
 
         try:
-            if not self.config_file.exists():
-                # Create default config if it doesn't exist
-                config = ProfileConfig()
+            try:
+                config_dict = self._read_config_dict(self.config_file)
+            except FileNotFoundError:
+                config = self._load_legacy_config() or ProfileConfig()
                 self.save_config(config)
                 return config
 
-            data = safe_read_file(self.config_file)
-            if not data:
-                self._config_cache = ProfileConfig()
-                return self._config_cache
-
-            config_dict = yaml.safe_load(data)
             if config_dict:
                 self._config_cache = ProfileConfig.from_dict(config_dict)
             else:
@@ -69,23 +146,50 @@ class ClaudeEnvManager:
 
             return self._config_cache
 
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Invalid YAML format in {self.config_file}: {e}")
+        except ConfigurationError:
+            raise
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON format in {self.config_file}: {e}")
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}")
 
-    def save_config(self, config: ProfileConfig) -> None:
-        """Save configuration to YAML file."""
-        try:
-            # Ensure parent directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+    def _encode_config(self, data: Dict[str, Any]) -> bytes:
+        """Encode config data as YAML or JSON bytes, depending on the file suffix."""
+        if self.config_file.suffix in _YAML_SUFFIXES:
+            import yaml
+
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            # libyaml encodes straight to bytes when given an encoding
+            return yaml.dump(
+                data,
+                Dumper=dumper,
+                default_flow_style=False,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+        return _dump_json(data)
 
-            data = config.to_dict()
-            yaml_str = yaml.dump(data, default_flow_style=False, sort_keys=False)
+    def _write_config(self, content: bytes, config: ProfileConfig) -> None:
+        """Write encoded config bytes and cache the matching config."""
+        # Skip the write entirely when nothing would change on disk; the
+        # atomic write creates the parent directory when needed
+        if not _matches_file(self.config_file, content):
+            safe_write_file(self.config_file, content)
+        self._config_cache = config
 
-            safe_write_file(self.config_file, yaml_str)
-            self._config_cache = config
+    def save_config(self, config: ProfileConfig) -> None:
+        """Save configuration to JSON (or YAML) file."""
+        try:
+            self._write_config(self._encode_config(config.to_dict()), config)
+        except Exception as e:
+            raise ConfigurationError(f"Failed to save configuration: {e}")
 
+    def save_raw_config(self, data: Dict[str, Any]) -> None:
+        """Save configuration from a plain dictionary without a model round-trip."""
+        try:
+            # Build the models first so invalid data never reaches disk
+            config = ProfileConfig.from_dict(data)
+            self._write_config(self._encode_config(data), config)
         except Exception as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
 
@@ -95,16 +199,15 @@ class ClaudeEnvManager:
             return self._settings_cache
 
         try:
-            if not self.settings_file.exists():
+            try:
+                settings_dict = _read_parsed(self.settings_file, _load_json)
+            except FileNotFoundError:
                 raise SettingsFileError(
                     f"Settings file not found: {self.settings_file}"
                 )
-
-            data = safe_read_file(self.settings_file)
-            if not data:
+            if settings_dict is None:
                 raise SettingsFileError(f"Settings file is empty: {self.settings_file}")
 
-            settings_dict = json.loads(data)
             self._settings_cache = ClaudeSettings.from_dict(settings_dict)
             return self._settings_cache
 
@@ -116,13 +219,15 @@ class ClaudeEnvManager:
     def save_settings(self, settings: ClaudeSettings) -> None:
         """Save Claude Code settings to JSON file."""
         try:
-            # Create backup before modifying
-            create_backup(self.settings_file)
-
             data = settings.to_dict()
-            json_str = json.dumps(data, indent=2)
+            json_bytes = _dump_json(data)
+
+            # Skip the backup and write entirely when nothing would change
+            if not _matches_file(self.settings_file, json_bytes):
+                # Create backup before modifying
+                create_backup(self.settings_file)
 
-            safe_write_file(self.settings_file, json_str)
+                safe_write_file(self.settings_file, json_bytes)
             self._settings_cache = settings
 
         except Exception as e:
@@ -185,14 +290,14 @@ class ClaudeEnvManager:
         if not profile:
             raise ProfileNotFoundError(f"Profile '{name}' not found")
 
-        # Update environment variables if provided
+        # Update through the config so its lookup indexes stay current
+        updates: Dict[str, Any] = {}
         if env_vars:
             validate_environment_vars(env_vars, partial=True)
-            profile.update_env(env_vars)
-
-        # Update description if provided
+            updates["env"] = env_vars
         if description is not None:
-            profile.description = description
+            updates["description"] = description
+        config.update_profile(name, **updates)
 
         # Save config
         self.save_config(config)
@@ -215,37 +320,38 @@ class ClaudeEnvManager:
     def apply_profile(self, name: str) -> bool:
         """Apply a profile to Claude Code settings."""
         try:
-            # Get the profile
-            profile = self.get_profile(name)
+            # Get the profile, keeping the config for the default-profile update
+            config = self.load_config()
+            profile = config.get_profile(name)
+            if not profile:
+                raise ProfileNotFoundError(f"Profile '{name}' not found")
 
             # Load current settings
             settings = self.load_settings()
 
-            # Update environment variables
-            new_env = profile.env.copy()
-
             # Preserve any non-Anthropic environment variables
-            for key, value in settings.env.items():
-                if not key.startswith("ANTHROPIC_"):
-                    new_env[key] = value
-
-            # Set API_TIMEOUT_MS to 600000 if not specified in profile
-            if "API_TIMEOUT_MS" not in new_env:
-                new_env["API_TIMEOUT_MS"] = "600000"
+            preserved = {
+                key: value
+                for key, value in settings.env.items()
+                if not key.startswith(_ANTHROPIC_PREFIX)
+            }
 
-            # Update settings
-            settings.env = new_env
+            # Build the new environment in one pass; API_TIMEOUT_MS defaults
+            # to 600000 unless the profile or the existing settings set it
+            settings.env = {"API_TIMEOUT_MS": "600000", **profile.env, **preserved}
 
             # Save settings
             self.save_settings(settings)
 
-            # Set as default profile
-            config = self.load_config()
-            config.default_profile = name
-            self.save_config(config)
+            # Set as default profile, skipping the save when it already is
+            if config.default_profile != name:
+                config.default_profile = name
+                self.save_config(config)
 
             return True
 
+        except ProfileNotFoundError:
+            raise
         except Exception as e:
             raise SettingsFileError(f"Failed to apply profile '{name}': {e}")
 
@@ -253,20 +359,13 @@ class ClaudeEnvManager:
         """Get the name of the current active profile."""
         try:
             settings = self.load_settings()
-            config = self.load_config()
-
-            # Find profile with matching environment variables
-            for profile in config.profiles:
-                # Check if ANTHROPIC_MODEL matches (good enough indicator)
-                if profile.env.get("ANTHROPIC_MODEL") == settings.env.get(
-                    "ANTHROPIC_MODEL"
-                ):
-                    return profile.name
-
+        except SettingsFileError:
+            # Missing or unreadable settings mean no profile is active
             return None
 
-        except Exception:
-            return None
+        # Match on ANTHROPIC_MODEL (good enough indicator)
+        profile = self.load_config().find_by_model(settings.env.get("ANTHROPIC_MODEL"))
+        return profile.name if profile else None
 
     def get_default_profile(self) -> Optional[str]:
         """Get the default profile name."""
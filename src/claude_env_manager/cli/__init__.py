@@ -1,6 +1,5 @@
 """CLI components for Claude Code Environment Manager."""
 
 from .commands import *
-from .interface import *
 
 __all__ = []
@@ -0,0 +1,72 @@
+"""The 'apply' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+from ..exceptions import (
+    ProfileNotFoundError,
+    SettingsFileError,
+)
+
+
+@click.command(name="apply")
+@click.option(
+    "--name", "-n", required=False, help="Profile name (uses default if not specified)"
+)
+@click.option(
+    "--force", "-f", is_flag=True, help="Force application without confirmation"
+)
+@click.pass_context
+def cmd(ctx, name, force):
+    """Apply a profile to Claude Code settings."""
+    from .interface import (
+        confirm_action_tui,
+        loading_tui,
+        show_error_tui,
+        show_info_tui,
+        show_operation_result,
+    )
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        # Confirm application unless forced, checking the profile exists first
+        if not force:
+            manager.get_profile(name)
+            if not confirm_action_tui(
+                f"Apply profile '{name}' to Claude Code settings?"
+            ):
+                show_info_tui("Profile application cancelled.")
+                return
+
+        # Apply profile with enhanced progress
+        if loading_tui("Applying profile", lambda: manager.apply_profile(name)):
+            show_operation_result(
+                "Profile Application",
+                True,
+                f"Profile '{name}' applied successfully to Claude Code settings.",
+            )
+        else:
+            show_error_tui(
+                f"Failed to apply profile '{name}'",
+                "Check profile configuration and Claude Code settings permissions.",
+            )
+            sys.exit(1)
+
+    except ProfileNotFoundError:
+        click.echo(f"Error: Profile '{name}' not found.", err=True)
+        sys.exit(1)
+    except SettingsFileError as e:
+        show_error_tui(
+            f"Settings file error: {e}",
+            "Check Claude Code installation and permissions.",
+        )
+        sys.exit(1)
+    except Exception as e:
+        show_error_tui(
+            f"Error applying profile: {e}",
+            "Please check your configuration and try again.",
+        )
+        sys.exit(1)
@@ -0,0 +1,42 @@
+"""The 'config' command for Claude Code Environment Manager."""
+
+import sys
+from pathlib import Path
+
+import click
+
+
+@click.command(name="config")
+@click.pass_context
+def cmd(ctx):
+    """Show configuration information."""
+    manager = ctx.obj["manager"]
+    verbose = ctx.obj["verbose"]
+
+    try:
+        click.echo("Configuration Information:")
+        click.echo(f"  Config file: {manager.get_config_path()}")
+        click.echo(f"  Settings file: {manager.get_settings_path()}")
+        click.echo(
+            f"  Claude Code installed: {Path(manager.get_settings_path()).exists()}"
+        )
+
+        if verbose:
+            profiles = manager.list_profiles()
+            click.echo(f"  Total profiles: {len(profiles)}")
+
+            default_profile = manager.get_default_profile()
+            if default_profile:
+                click.echo(f"  Default profile: {default_profile}")
+            else:
+                click.echo("  Default profile: None")
+
+            current_profile = manager.get_current_profile()
+            if current_profile:
+                click.echo(f"  Current profile: {current_profile}")
+            else:
+                click.echo("  Current profile: None")
+
+    except Exception as e:
+        click.echo(f"Error showing configuration: {e}", err=True)
+        sys.exit(1)
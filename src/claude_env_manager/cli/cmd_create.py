@@ -0,0 +1,108 @@
+"""The 'create' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+from ..exceptions import (
+    ProfileExistsError,
+    ValidationError,
+)
+from ..utils.validation import validate_profile_name
+
+
+@click.command(name="create")
+@click.option(
+    "--name",
+    "-n",
+    required=False,
+    help="Profile name (required in non-interactive mode)",
+)
+@click.option("--base-url", "-b", help="Anthropic base URL")
+@click.option("--api-key", "-k", help="Anthropic API key")
+@click.option("--model", "-m", help="Anthropic model")
+@click.option("--fast-model", "-f", help="Anthropic fast model")
+@click.option("--description", "-d", help="Profile description")
+@click.option("--interactive", "-i", is_flag=True, help="Interactive mode")
+@click.pass_context
+def cmd(ctx, name, base_url, api_key, model, fast_model, description, interactive):
+    """Create a new environment profile."""
+    from .interface import (
+        create_profile_tui,
+        loading_tui,
+        show_error_tui,
+        show_operation_result,
+    )
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        # In non-interactive mode, validate profile name
+        if not interactive and not name:
+            click.echo("Error: --name is required in non-interactive mode.", err=True)
+            sys.exit(1)
+
+        if not interactive:
+            # Validate profile name for non-interactive mode
+            validate_profile_name(name)
+
+        if interactive:
+            # Use enhanced TUI for interactive creation
+            profile = create_profile_tui()
+            if profile:
+                loading_tui(
+                    "Creating profile",
+                    lambda: manager.create_profile(
+                        profile.name, profile.env, profile.description
+                    ),
+                )
+                show_operation_result(
+                    "Profile Creation",
+                    True,
+                    f"Profile '{profile.name}' created successfully.",
+                )
+        else:
+            # Check for required parameters
+            if not all([base_url, api_key, model, fast_model]):
+                show_error_tui(
+                    "Missing required parameters",
+                    "All of --base-url, --api-key, --model, and "
+                    "--fast-model are required in non-interactive mode.",
+                )
+                sys.exit(1)
+
+            # Create environment variables dictionary
+            env_vars = {
+                "ANTHROPIC_BASE_URL": base_url,
+                "ANTHROPIC_API_KEY": api_key,
+                "ANTHROPIC_MODEL": model,
+                "ANTHROPIC_SMALL_FAST_MODEL": fast_model,
+            }
+
+            # Create profile; create_profile validates the variables
+            loading_tui(
+                "Creating profile",
+                lambda: manager.create_profile(name, env_vars, description),
+            )
+            show_operation_result(
+                "Profile Creation", True, f"Profile '{name}' created successfully."
+            )
+
+    except ProfileExistsError as e:
+        show_error_tui(
+            f"Profile creation failed: {e}",
+            "Use a different profile name or update existing profile.",
+        )
+        sys.exit(1)
+    except (ValidationError, ValueError) as e:
+        show_error_tui(
+            f"Validation error: {e}", "Check your input values and try again."
+        )
+        sys.exit(1)
+    except Exception as e:
+        show_error_tui(
+            f"Error creating profile: {e}",
+            "Please check the error details and try again.",
+        )
+        sys.exit(1)
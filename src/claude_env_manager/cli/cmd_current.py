@@ -0,0 +1,25 @@
+"""The 'current' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+
+@click.command(name="current")
+@click.pass_context
+def cmd(ctx):
+    """Show current active profile."""
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        current = manager.get_current_profile()
+        if current:
+            click.echo(f"Current profile: {current}")
+        else:
+            if not quiet:
+                click.echo("No active profile found.")
+
+    except Exception as e:
+        click.echo(f"Error getting current profile: {e}", err=True)
+        sys.exit(1)
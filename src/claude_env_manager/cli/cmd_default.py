@@ -0,0 +1,28 @@
+"""The 'default' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+from ..exceptions import ProfileNotFoundError
+
+
+@click.command(name="default")
+@click.option("--name", "-n", required=True, help="Profile name")
+@click.pass_context
+def cmd(ctx, name):
+    """Set the default profile."""
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        manager.set_default_profile(name)
+        if not quiet:
+            click.echo(f"✅ Default profile set to '{name}'.")
+
+    except ProfileNotFoundError:
+        click.echo(f"Error: Profile '{name}' not found.", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Error setting default profile: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,43 @@
+"""The 'delete' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+from ..exceptions import ProfileNotFoundError
+
+
+@click.command(name="delete")
+@click.option("--name", "-n", required=True, help="Profile name")
+@click.option("--force", "-f", is_flag=True, help="Force deletion without confirmation")
+@click.pass_context
+def cmd(ctx, name, force):
+    """Delete an environment profile."""
+    from .interface import confirm_action_tui
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        # Confirm deletion unless forced, checking the profile exists first
+        if not force:
+            manager.get_profile(name)
+            if not confirm_action_tui(f"Delete profile '{name}'?"):
+                if not quiet:
+                    click.echo("Deletion cancelled.")
+                return
+
+        # Delete profile
+        if manager.delete_profile(name):
+            if not quiet:
+                click.echo(f"✅ Profile '{name}' deleted successfully.")
+        else:
+            click.echo(f"Error: Failed to delete profile '{name}'.", err=True)
+            sys.exit(1)
+
+    except ProfileNotFoundError:
+        click.echo(f"Error: Profile '{name}' not found.", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Error deleting profile: {e}", err=True)
+        sys.exit(1)
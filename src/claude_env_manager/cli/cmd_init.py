@@ -0,0 +1,47 @@
+"""The 'init' command for Claude Code Environment Manager."""
+
+import sys
+from pathlib import Path
+
+import click
+
+
+@click.command(name="init")
+@click.option(
+    "--force", "-f", is_flag=True, help="Force initialization without confirmation"
+)
+@click.pass_context
+def cmd(ctx, force):
+    """Initialize configuration files."""
+    from .interface import confirm_action_tui
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        # Check if already initialized
+        config_path = Path(manager.get_config_path())
+        if config_path.exists() and not force:
+            if not confirm_action_tui(
+                "Configuration file already exists. Reinitialize?"
+            ):
+                if not quiet:
+                    click.echo("Initialization cancelled.")
+                return
+
+        # Create default configuration, written straight from the raw data
+        from ..utils.config import create_default_config
+
+        manager.save_raw_config(create_default_config())
+
+        if not quiet:
+            click.echo(f"✅ Configuration initialized at {manager.get_config_path()}")
+            click.echo(f"✅ Default profile 'development' created")
+            click.echo(
+                "Use 'claude-env-manager apply development' to "
+                "apply default profile."
+            )
+
+    except Exception as e:
+        click.echo(f"Error initializing configuration: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,61 @@
+"""The 'list' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+
+@click.command(name="list")
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(["table", "json", "yaml"]),
+    default="table",
+    help="Output format",
+)
+@click.pass_context
+def cmd(ctx, format):
+    """List all environment profiles with enhanced display."""
+    from .interface import (
+        list_profiles_tui,
+        loading_tui,
+        show_empty_state,
+        show_error_tui,
+    )
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+    verbose = ctx.obj["verbose"]
+
+    try:
+        profiles = loading_tui("Loading profiles", manager.list_profiles)
+        default_profile = manager.get_default_profile()
+
+        if not profiles:
+            if not quiet:
+                show_empty_state(
+                    "No profiles found", "Use 'create' to add your first profile."
+                )
+            return
+
+        if format == "table":
+            list_profiles_tui(profiles, verbose, default_profile)
+        elif format == "json":
+            import json
+
+            data = [p.to_dict() for p in profiles]
+            click.echo(json.dumps(data, indent=2))
+        elif format == "yaml":
+            import yaml
+
+            # Prefer the libyaml-backed C dumper when available
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            data = [p.to_dict() for p in profiles]
+            click.echo(yaml.dump(data, Dumper=dumper, default_flow_style=False))
+
+    except Exception as e:
+        show_error_tui(
+            f"Error listing profiles: {e}",
+            "Check configuration file permissions and format.",
+        )
+        sys.exit(1)
@@ -0,0 +1,47 @@
+"""The 'show' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+from ..exceptions import ProfileNotFoundError
+
+
+@click.command(name="show")
+@click.option(
+    "--name", "-n", help="Profile name (if not specified, shows interactive selector)"
+)
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(["table", "json", "yaml"]),
+    default="table",
+    help="Output format",
+)
+@click.pass_context
+def cmd(ctx, name, format):
+    """Show profile details."""
+    from .interface import select_profile_tui, show_profile_details_tui
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        if name:
+            # Show specific profile
+            profile = manager.get_profile(name)
+            show_profile_details_tui(profile, format)
+        else:
+            # Interactive profile selection
+            selected_profile = select_profile_tui(manager)
+            if selected_profile:
+                show_profile_details_tui(selected_profile, format)
+            elif not quiet:
+                click.echo("No profile selected.")
+
+    except ProfileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Error showing profile: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,72 @@
+"""The 'update' command for Claude Code Environment Manager."""
+
+import sys
+
+import click
+
+from ..exceptions import (
+    ProfileNotFoundError,
+    ValidationError,
+)
+
+
+@click.command(name="update")
+@click.option(
+    "--name",
+    "-n",
+    required=False,
+    help="Profile name (required in non-interactive mode)",
+)
+@click.option("--base-url", "-b", help="Anthropic base URL")
+@click.option("--api-key", "-k", help="Anthropic API key")
+@click.option("--model", "-m", help="Anthropic model")
+@click.option("--fast-model", "-f", help="Anthropic fast model")
+@click.option("--description", "-d", help="Profile description")
+@click.option("--interactive", "-i", is_flag=True, help="Interactive mode")
+@click.pass_context
+def cmd(ctx, name, base_url, api_key, model, fast_model, description, interactive):
+    """Update an existing environment profile."""
+    from .interface import edit_profile_tui
+
+    manager = ctx.obj["manager"]
+    quiet = ctx.obj["quiet"]
+
+    try:
+        # In non-interactive mode, validate profile name
+        if not interactive and not name:
+            click.echo("Error: --name is required in non-interactive mode.", err=True)
+            sys.exit(1)
+
+        if interactive:
+            # Use TUI for interactive editing
+            profile = edit_profile_tui(manager, name)
+            if profile:
+                manager.update_profile(name, profile.env, profile.description)
+                if not quiet:
+                    click.echo(f"✅ Profile '{name}' updated successfully.")
+        else:
+            # Build update parameters
+            env_vars = {}
+            if base_url:
+                env_vars["ANTHROPIC_BASE_URL"] = base_url
+            if api_key:
+                env_vars["ANTHROPIC_API_KEY"] = api_key
+            if model:
+                env_vars["ANTHROPIC_MODEL"] = model
+            if fast_model:
+                env_vars["ANTHROPIC_SMALL_FAST_MODEL"] = fast_model
+
+            # Update profile
+            manager.update_profile(name, env_vars or None, description)
+            if not quiet:
+                click.echo(f"✅ Profile '{name}' updated successfully.")
+
+    except ProfileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except (ValidationError, ValueError) as e:
+        click.echo(f"Validation error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Error updating profile: {e}", err=True)
+        sys.exit(1)
@@ -1,26 +1,24 @@
 """TUI interface components for Claude Code Environment Manager."""
 
+import functools
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
-import yaml
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeRemainingColumn,
-)
-from rich.prompt import Confirm, Prompt
-from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
-from ..models import EnvironmentProfile
+from ..models import REQUIRED_ENV_VARS, EnvironmentProfile
+
+# rich.prompt and rich.progress are imported inside the functions that use
+# them, so commands that only print never load them
+
+T = TypeVar("T")
 
 # Custom theme for consistent styling
 custom_theme = Theme(
@@ -37,7 +35,95 @@ custom_theme = Theme(
     }
 )
 
-console = Console(theme=custom_theme)
+# All styling comes from explicit markup, so Rich's automatic highlighting and
+# :emoji: code replacement are disabled to skip their per-print regex passes
+console = Console(theme=custom_theme, highlight=False, emoji=False)
+
+# Rows rendered per table in list_profiles_tui, so output starts after the
+# first page is measured instead of after the whole profile list
+LIST_PAGE_SIZE = 200
+
+# Rows shown at once by select_profile_tui; other pages are reached with n/p
+SELECT_PAGE_SIZE = 20
+
+
+# Display names for the profile variables, computed once at import
+_DISPLAY_KEY = {
+    key: key.removeprefix("ANTHROPIC_").replace("_", " ").title()
+    for key in REQUIRED_ENV_VARS
+}
+
+# Prompt labels for the profile variables, styled once instead of per prompt
+_ENV_PROMPTS = {key: Text(key, style="cyan") for key in REQUIRED_ENV_VARS}
+
+# Values offered when creating a profile; the API key has no default
+_CREATE_DEFAULTS = {
+    "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
+    "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
+    "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307",
+}
+
+
+def _display_key(key: str) -> str:
+    """Get the display name for an environment variable."""
+    display_key = _DISPLAY_KEY.get(key)
+    if display_key is None:
+        # Extra variables are formatted on demand and not cached
+        display_key = key.removeprefix("ANTHROPIC_").replace("_", " ").title()
+    return display_key
+
+
+# Groups of environment variables in the profile details view
+_ENV_GROUPS = {
+    "Authentication": ("ANTHROPIC_API_KEY",),
+    "Configuration": (
+        "ANTHROPIC_BASE_URL",
+        "ANTHROPIC_MODEL",
+        "ANTHROPIC_SMALL_FAST_MODEL",
+    ),
+}
+_KNOWN_ENV_KEYS = frozenset(key for keys in _ENV_GROUPS.values() for key in keys)
+
+# Variables whose values are masked in the details view
+_MASKED_ENV_KEYS = frozenset(("ANTHROPIC_API_KEY",))
+
+# Prompt label for select_profile_tui, styled once for every re-prompt
+_SELECT_PROMPT = Text("Select profile", style="primary")
+
+# Cells reused by every row of the profile list
+_DEFAULT_MARK = Text("✓", style="bold success")
+_MASKED_API_KEY = Text("sk-" + "•" * 8 + "...")
+_API_KEY_NOT_SET = Text("Not set", style="error")
+
+# Masked API key shown in the profile details view
+_MASKED_API_KEY_DETAIL = "sk-" + "•" * 12 + "..."
+
+
+def _ask_env_vars(defaults: Dict[str, str]) -> Dict[str, str]:
+    """Prompt for each profile variable in turn, offering any given defaults."""
+    from rich.prompt import Prompt
+
+    console.print("\n[bold]Environment Variables:[/bold]")
+
+    env_vars = {}
+    for key, prompt in _ENV_PROMPTS.items():
+        if key in defaults:
+            env_vars[key] = Prompt.ask(prompt, default=defaults[key])
+        else:
+            env_vars[key] = Prompt.ask(prompt)
+    return env_vars
+
+
+def _format_time(value: datetime) -> str:
+    """Format a timestamp as 'YYYY-MM-DD HH:MM:SS'."""
+    # isoformat is C-implemented; slicing drops any UTC offset like strftime did
+    return value.isoformat(sep=" ", timespec="seconds")[:19]
+
+
+def _trunc(value: str, width: int) -> str:
+    """Truncate a value to width characters, marking cut text with an ellipsis."""
+    # A single '…' matches Rich's own overflow marker and keeps more of the text
+    return value if len(value) <= width else value[: width - 1] + "…"
 
 
 def list_profiles_tui(
@@ -59,8 +145,44 @@ def list_profiles_tui(
 
     console.print(Panel(header_content, box=box.ROUNDED, border_style="primary"))
 
-    # Create table
-    table = Table(box=box.ROUNDED, expand=True)
+    # Sort profiles by name and default status; nothing to order for one profile
+    if len(profiles) == 1:
+        sorted_profiles = profiles
+    else:
+        sorted_profiles = sorted(
+            profiles,
+            key=lambda p: (
+                p.name != default_profile,  # Default profile first
+                p.name.lower(),  # Then alphabetical
+            ),
+        )
+
+    # Render one page of rows at a time; fixed column widths keep pages aligned
+    rows = iter(sorted_profiles)
+    show_header = True
+    while True:
+        page = list(islice(rows, LIST_PAGE_SIZE))
+        if not page:
+            break
+        _print_profile_page(page, verbose, default_profile, show_header)
+        show_header = False
+
+    # Add footer with action hints
+    footer_content = (
+        "[dim]Use 'show <name>' for details • 'apply <name>' to activate"
+        " • 'create' to add new[/dim]"
+    )
+    console.print(Panel(footer_content, box=box.ROUNDED, border_style="muted"))
+
+
+def _print_profile_page(
+    profiles: List[EnvironmentProfile],
+    verbose: bool,
+    default_profile: Optional[str],
+    show_header: bool,
+) -> None:
+    """Print one page of the profile list as a table."""
+    table = Table(box=box.ROUNDED, expand=True, show_header=show_header)
 
     # Add columns with better styling
     table.add_column("Name", style="accent", no_wrap=True, width=15)
@@ -72,67 +194,43 @@ def list_profiles_tui(
     table.add_column("Description", style="muted", width=30)
     table.add_column("Default", style="success", justify="center", width=8)
 
-    # Sort profiles by name and default status
-    sorted_profiles = sorted(
-        profiles,
-        key=lambda p: (
-            0 if p.name == default_profile else 1,  # Default profile first
-            p.name.lower(),  # Then alphabetical
-        ),
-    )
-
     # Add rows with enhanced styling
-    for profile in sorted_profiles:
-        # Truncate values for display
-        base_url = profile.env.get("ANTHROPIC_BASE_URL", "")
-        if len(base_url) > 35:
-            base_url = base_url[:32] + "..."
-
-        model = profile.env.get("ANTHROPIC_MODEL", "")
-        if len(model) > 25:
-            model = model[:22] + "..."
+    for profile in profiles:
+        get = profile.env.get
 
-        description = profile.description or ""
-        if len(description) > 30:
-            description = description[:27] + "..."
+        # Truncate values for display
+        base_url = _trunc(get("ANTHROPIC_BASE_URL", ""), 35)
+        model = _trunc(get("ANTHROPIC_MODEL", ""), 25)
+        description = _trunc(profile.description or "", 30)
 
-        # Determine row styling based on profile status
-        name_style = "bold accent" if profile.name == default_profile else "accent"
+        # Determine row styling based on profile status, checked once per row;
+        # cells are Text so profile values are never parsed as markup
+        is_default = profile.name == default_profile
+        name_style = "bold accent" if is_default else "accent"
 
         # Build row
-        row = [f"[{name_style}]{profile.name}[/]", base_url, model]
+        row = [Text(profile.name, style=name_style), Text(base_url), Text(model)]
 
         if verbose:
-            fast_model = profile.env.get("ANTHROPIC_SMALL_FAST_MODEL", "")
-            if len(fast_model) > 20:
-                fast_model = fast_model[:17] + "..."
+            fast_model = _trunc(get("ANTHROPIC_SMALL_FAST_MODEL", ""), 20)
 
-            api_key = profile.env.get("ANTHROPIC_API_KEY", "")
-            if api_key and api_key.startswith("sk-"):
+            if profile.has_valid_api_key:
                 # Show masked API key
-                api_key = "sk-" + "•" * 8 + "..."
+                api_key_cell = _MASKED_API_KEY
             else:
-                api_key = "[error]Not set[/error]"
+                api_key_cell = _API_KEY_NOT_SET
 
-            row.extend([fast_model, api_key])
+            row.extend([Text(fast_model), api_key_cell])
 
-        row.append(description)
+        row.append(Text(description))
 
         # Add default marker with enhanced styling
-        is_default = default_profile == profile.name
-        if is_default:
-            row.append("[bold success]✓[/]")
-        else:
-            row.append("")
+        row.append(_DEFAULT_MARK if is_default else "")
 
         table.add_row(*row)
 
     console.print(table)
 
-    # Add footer with action hints
-    footer_content = "[dim]Use 'show <name>' for details • 'apply <name>' to activate • 'create' to add new[/dim]"
-    console.print(Panel(footer_content, box=box.ROUNDED, border_style="muted"))
-
 
 def show_profile_details_tui(
     profile: EnvironmentProfile, format: str = "table"
@@ -143,7 +241,11 @@ def show_profile_details_tui(
         return
 
     if format == "yaml":
-        yaml_str = yaml.dump(profile.to_dict(), default_flow_style=False)
+        # Imported here so other views never pay the PyYAML import cost
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        yaml_str = yaml.dump(profile.to_dict(), Dumper=dumper, default_flow_style=False)
         console.print(
             Panel(
                 yaml_str,
@@ -173,8 +275,8 @@ def show_profile_details_tui(
     meta_table.add_row(
         "Description", profile.description or "[dim]No description[/dim]"
     )
-    meta_table.add_row("Created", profile.created.strftime("%Y-%m-%d %H:%M:%S"))
-    meta_table.add_row("Modified", profile.modified.strftime("%Y-%m-%d %H:%M:%S"))
+    meta_table.add_row("Created", _format_time(profile.created))
+    meta_table.add_row("Modified", _format_time(profile.modified))
 
     console.print(meta_table)
 
@@ -188,64 +290,43 @@ def show_profile_details_tui(
         )
     )
 
-    env_table = Table(box=box.ROUNDED, expand=True)
-    env_table.add_column("Variable", style="warning", width=25)
-    env_table.add_column("Value", style="info", width=45)
-
-    # Group environment variables for better organization
-    env_vars = {
-        "Authentication": ["ANTHROPIC_API_KEY"],
-        "Configuration": [
-            "ANTHROPIC_BASE_URL",
-            "ANTHROPIC_MODEL",
-            "ANTHROPIC_SMALL_FAST_MODEL",
-        ],
-    }
-
-    # Add environment variables by category
-    for category, keys in env_vars.items():
-        if category == "Authentication":
-            env_table.add_row(f"[bold {category.lower()}]{category}[/bold]", "")
-            for key in keys:
-                if key in profile.env:
-                    value = profile.env[key]
-                    if value and value.startswith("sk-"):
-                        display_value = "sk-" + "•" * 12 + "..."
-                    else:
-                        display_value = "[error]Invalid format[/error]"
-                    display_key = (
-                        key.replace("ANTHROPIC_", "").replace("_", " ").title()
-                    )
-                    env_table.add_row(
-                        f"[{category.lower()}]{display_key}[/]", display_value
-                    )
-        elif category == "Configuration":
-            env_table.add_row(f"[bold {category.lower()}]{category}[/bold]", "")
-            for key in keys:
-                if key in profile.env:
-                    value = profile.env[key]
-                    display_key = (
-                        key.replace("ANTHROPIC_", "").replace("_", " ").title()
-                    )
-                    env_table.add_row(f"[{category.lower()}]{display_key}[/]", value)
+    # Add environment variables by category, masking secret values
+    env = profile.env
+    rows: List[Tuple[str, str]] = []
+    for category, keys in _ENV_GROUPS.items():
+        style = category.lower()
+        rows.append((f"[bold {style}]{category}[/]", ""))
+        for key in keys:
+            if key not in env:
+                continue
+            value = env[key]
+            if key in _MASKED_ENV_KEYS:
+                if value.startswith("sk-"):
+                    value = _MASKED_API_KEY_DETAIL
+                else:
+                    value = "[error]Invalid format[/error]"
+            rows.append((f"[{style}]{_display_key(key)}[/]", value))
 
     # Add any additional environment variables
-    additional_vars = [
-        k for k in profile.env.keys() if k not in sum(env_vars.values(), [])
-    ]
+    additional_vars = [k for k in env if k not in _KNOWN_ENV_KEYS]
     if additional_vars:
-        env_table.add_row("[bold info]Additional[/bold]", "")
-        for key in additional_vars:
-            value = profile.env[key]
-            display_key = key.replace("ANTHROPIC_", "").replace("_", " ").title()
-            env_table.add_row(f"[info]{display_key}[/]", value)
+        rows.append(("[bold info]Additional[/]", ""))
+        rows.extend(
+            (f"[info]{_display_key(key)}[/]", env[key]) for key in additional_vars
+        )
+
+    env_table = Table(box=box.ROUNDED, expand=True)
+    env_table.add_column("Variable", style="warning", width=25)
+    env_table.add_column("Value", style="info", width=45)
+    for row in rows:
+        env_table.add_row(*row)
 
     console.print(env_table)
 
     # Add validation status
     console.print()  # Spacing
     try:
-        profile.__post_init__()  # This will raise ValueError if invalid
+        profile.validate()  # This will raise ValueError if invalid
         validation_status = "[success]✓ Valid[/success]"
     except ValueError as e:
         validation_status = f"[error]✗ Invalid: {e}[/error]"
@@ -261,6 +342,8 @@ def show_profile_details_tui(
 
 def select_profile_tui(manager) -> Optional[EnvironmentProfile]:
     """Interactive profile selection with enhanced UI."""
+    from rich.prompt import Prompt
+
     profiles = manager.list_profiles()
 
     if not profiles:
@@ -278,6 +361,72 @@ def select_profile_tui(manager) -> Optional[EnvironmentProfile]:
         )
     )
 
+    # Get default profile for highlighting
+    default_profile = manager.get_default_profile()
+
+    offset = 0
+    while True:
+        # Only the visible window of profiles is turned into table rows
+        window = profiles[offset : offset + SELECT_PAGE_SIZE]
+        has_next = offset + len(window) < len(profiles)
+        _print_selection_page(window, offset, default_profile)
+
+        # Add footer with instructions
+        footer_content = (
+            "[dim]Enter number to select • 'q' to quit • 'c' to create new profile"
+        )
+        if has_next or offset:
+            last_page = (len(profiles) - 1) // SELECT_PAGE_SIZE + 1
+            page_number = offset // SELECT_PAGE_SIZE + 1
+            footer_content += (
+                f" • 'n'/'p' for next/previous page ({page_number}/{last_page})"
+            )
+        footer_content += "[/dim]"
+        console.print(Panel(footer_content, box=box.ROUNDED, border_style="muted"))
+
+        # Get user selection with enhanced error handling
+        while True:
+            try:
+                choice = Prompt.ask(_SELECT_PROMPT).strip().lower()
+
+                if choice == "q":
+                    show_info_tui("Selection cancelled.")
+                    return None
+
+                if choice == "c":
+                    console.print()
+                    show_info_tui("Creating new profile...")
+                    return create_profile_tui()
+
+                if choice == "n" and has_next:
+                    offset += SELECT_PAGE_SIZE
+                    break
+
+                if choice == "p" and offset:
+                    offset -= SELECT_PAGE_SIZE
+                    break
+
+                # Any profile number is accepted, not only those on this page
+                number = int(choice) if choice.isdigit() else 0
+                if not 1 <= number <= len(profiles):
+                    show_error_tui("Invalid selection. Please try again.")
+                    time.sleep(1)  # Brief pause for better UX
+                    continue
+
+                selected_profile = profiles[number - 1]
+                show_success_tui(f"Selected profile: {selected_profile.name}")
+                return selected_profile
+
+            except KeyboardInterrupt:
+                console.print()
+                show_info_tui("Selection cancelled.")
+                return None
+
+
+def _print_selection_page(
+    profiles: List[EnvironmentProfile], offset: int, default_profile: Optional[str]
+) -> None:
+    """Print one page of the profile selection table, numbered from offset."""
     # Create selection table with better styling
     table = Table(box=box.ROUNDED, expand=True)
     table.add_column("#", style="accent", justify="right", width=3)
@@ -286,72 +435,32 @@ def select_profile_tui(manager) -> Optional[EnvironmentProfile]:
     table.add_column("Model", style="secondary", width=20)
     table.add_column("Description", style="muted", width=25)
 
-    # Get default profile for highlighting
-    default_profile = manager.get_default_profile()
-
     # Add profiles to table
-    for i, profile in enumerate(profiles):
-        base_url = profile.env.get("ANTHROPIC_BASE_URL", "")
-        if len(base_url) > 30:
-            base_url = base_url[:27] + "..."
-
-        model = profile.env.get("ANTHROPIC_MODEL", "")
-        if len(model) > 18:
-            model = model[:15] + "..."
-
-        description = profile.description or ""
-        if len(description) > 25:
-            description = description[:22] + "..."
+    for i, profile in enumerate(profiles, start=offset + 1):
+        get = profile.env.get
+        base_url = _trunc(get("ANTHROPIC_BASE_URL", ""), 30)
+        model = _trunc(get("ANTHROPIC_MODEL", ""), 18)
+        description = _trunc(profile.description or "", 25)
 
         # Highlight default profile
         name_style = "bold accent" if profile.name == default_profile else "accent"
 
         table.add_row(
-            str(i + 1), f"[{name_style}]{profile.name}[/]", base_url, model, description
+            str(i),
+            Text(profile.name, style=name_style),
+            Text(base_url),
+            Text(model),
+            Text(description),
         )
 
     console.print(table)
 
-    # Add footer with instructions
-    footer_content = (
-        "[dim]Enter number to select • 'q' to quit • 'c' to create new profile[/dim]"
-    )
-    console.print(Panel(footer_content, box=box.ROUNDED, border_style="muted"))
-
-    # Get user selection with enhanced error handling
-    while True:
-        try:
-            choices = [str(i + 1) for i in range(len(profiles))] + ["q", "c"]
-            choice = Prompt.ask(
-                "[primary]Select profile[/primary]", choices=choices, show_choices=False
-            )
-
-            if choice.lower() == "q":
-                show_info_tui("Selection cancelled.")
-                return None
-
-            if choice.lower() == "c":
-                console.print()
-                show_info_tui("Creating new profile...")
-                return create_profile_tui()
-
-            index = int(choice) - 1
-            if 0 <= index < len(profiles):
-                selected_profile = profiles[index]
-                show_success_tui(f"Selected profile: {selected_profile.name}")
-                return selected_profile
-
-        except (ValueError, KeyboardInterrupt):
-            show_error_tui("Invalid selection. Please try again.")
-            time.sleep(1)  # Brief pause for better UX
-            continue
-
 
 def create_profile_tui() -> Optional[EnvironmentProfile]:
     """Interactive profile creation."""
-    console.print(
-        Panel.fit("[bold green]Create New Profile[/bold green]", box=box.ROUNDED)
-    )
+    from rich.prompt import Confirm, Prompt
+
+    console.print(_create_profile_header())
 
     try:
         # Get profile name
@@ -364,40 +473,13 @@ def create_profile_tui() -> Optional[EnvironmentProfile]:
         description = Prompt.ask("[cyan]Description (optional)[/cyan]", default="")
 
         # Get environment variables
-        console.print("\n[bold]Environment Variables:[/bold]")
-
-        base_url = Prompt.ask(
-            "[cyan]ANTHROPIC_BASE_URL[/cyan]", default="https://api.anthropic.com"
-        )
-
-        api_key = Prompt.ask("[cyan]ANTHROPIC_API_KEY[/cyan]")
-
-        model = Prompt.ask(
-            "[cyan]ANTHROPIC_MODEL[/cyan]", default="claude-3-5-sonnet-20241022"
-        )
-
-        fast_model = Prompt.ask(
-            "[cyan]ANTHROPIC_SMALL_FAST_MODEL[/cyan]", default="claude-3-haiku-20240307"
-        )
-
-        # Create environment variables dictionary
-        env_vars = {
-            "ANTHROPIC_BASE_URL": base_url,
-            "ANTHROPIC_API_KEY": api_key,
-            "ANTHROPIC_MODEL": model,
-            "ANTHROPIC_SMALL_FAST_MODEL": fast_model,
-        }
-
-        # Create profile
-        from ..models import EnvironmentProfile
+        env_vars = _ask_env_vars(_CREATE_DEFAULTS)
 
+        # Create profile; construction validates it and raises ValueError if invalid
         profile = EnvironmentProfile(
             name=name, env=env_vars, description=description or None
         )
 
-        # Validate profile
-        profile.__post_init__()  # This will raise ValueError if invalid
-
         # Show summary
         console.print("\n[bold green]Profile Summary:[/bold green]")
         show_profile_details_tui(profile)
@@ -419,6 +501,8 @@ def create_profile_tui() -> Optional[EnvironmentProfile]:
 
 def edit_profile_tui(manager, profile_name: str) -> Optional[EnvironmentProfile]:
     """Interactive profile editing."""
+    from rich.prompt import Confirm, Prompt
+
     try:
         # Get existing profile
         profile = manager.get_profile(profile_name)
@@ -441,36 +525,9 @@ def edit_profile_tui(manager, profile_name: str) -> Optional[EnvironmentProfile]
             "[cyan]Description[/cyan]", default=profile.description or ""
         )
 
-        # Get environment variables
-        console.print("\n[bold]Environment Variables:[/bold]")
-
-        new_base_url = Prompt.ask(
-            "[cyan]ANTHROPIC_BASE_URL[/cyan]",
-            default=profile.env.get("ANTHROPIC_BASE_URL", ""),
-        )
-
-        new_api_key = Prompt.ask(
-            "[cyan]ANTHROPIC_API_KEY[/cyan]",
-            default=profile.env.get("ANTHROPIC_API_KEY", ""),
-        )
-
-        new_model = Prompt.ask(
-            "[cyan]ANTHROPIC_MODEL[/cyan]",
-            default=profile.env.get("ANTHROPIC_MODEL", ""),
-        )
-
-        new_fast_model = Prompt.ask(
-            "[cyan]ANTHROPIC_SMALL_FAST_MODEL[/cyan]",
-            default=profile.env.get("ANTHROPIC_SMALL_FAST_MODEL", ""),
-        )
-
-        # Create updated environment variables
-        new_env_vars = {
-            "ANTHROPIC_BASE_URL": new_base_url,
-            "ANTHROPIC_API_KEY": new_api_key,
-            "ANTHROPIC_MODEL": new_model,
-            "ANTHROPIC_SMALL_FAST_MODEL": new_fast_model,
-        }
+        # Get environment variables, defaulting to the current values
+        get = profile.env.get
+        new_env_vars = _ask_env_vars({key: get(key, "") for key in REQUIRED_ENV_VARS})
 
         # Check if anything changed
         env_changed = new_env_vars != profile.env
@@ -490,7 +547,7 @@ def edit_profile_tui(manager, profile_name: str) -> Optional[EnvironmentProfile]
             updated_profile.description = new_description or None
 
         # Validate updated profile
-        updated_profile.__post_init__()  # This will raise ValueError if invalid
+        updated_profile.validate()  # This will raise ValueError if invalid
 
         # Show summary
         console.print("\n[bold green]Updated Profile:[/bold green]")
@@ -524,6 +581,8 @@ def show_empty_state(title: str, message: str) -> None:
 
 def confirm_action_tui(message: str) -> bool:
     """Confirm an action with user."""
+    from rich.prompt import Confirm
+
     return Confirm.ask(f"[error]{message}[/error]")
 
 
@@ -535,8 +594,12 @@ def show_success_tui(message: str) -> None:
 def show_error_tui(message: str, suggestion: str = "") -> None:
     """Show error message with optional suggestion."""
     error_content = f"[error]❌ {message}[/error]"
-    if suggestion:
-        error_content += f"\n[dim]💡 {suggestion}[/dim]"
+    if not suggestion:
+        # A single line needs no frame
+        console.print(error_content)
+        return
+
+    error_content += f"\n[dim]💡 {suggestion}[/dim]"
     console.print(Panel(error_content, box=box.ROUNDED, border_style="error"))
 
 
@@ -553,24 +616,53 @@ def show_info_tui(message: str) -> None:
 def progress_tui(message: str, current: int, total: int) -> None:
     """Show progress message."""
     percentage = (current / total) * 100
-    progress_content = f"[info]⏳ {message}[/info] • [primary]{percentage:.1f}%[/primary] ([success]{current}/{total}[/success])"
+    # Assembled from styled parts so the message is never parsed as markup
+    progress_content = Text.assemble(
+        (f"⏳ {message}", "info"),
+        " • ",
+        (f"{percentage:.1f}%", "primary"),
+        " (",
+        (f"{current}/{total}", "success"),
+        ")",
+    )
     console.print(Panel(progress_content, box=box.ROUNDED, border_style="info"))
 
 
-def loading_tui(message: str) -> None:
-    """Show loading message with spinner."""
+def _should_show_progress(total_items: int) -> bool:
+    """Check whether a task is long enough to warrant a live progress bar."""
+    return total_items > 3
+
+
+def loading_tui(message: str, work: Optional[Callable[[], T]] = None) -> Optional[T]:
+    """Show a spinner while running work, returning its result."""
+    if not console.is_terminal:
+        # A spinner never animates off a terminal; just run the work
+        return work() if work is not None else None
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task(f"[bold blue]{message}...[/bold blue]", total=None)
-        # Simulate some work - in real usage, this would be replaced with actual work
-        time.sleep(0.1)
+        progress.add_task(f"[bold blue]{message}...[/bold blue]", total=None)
+        return work() if work is not None else None
+
+
+def show_progress_with_steps(
+    message: str, steps: Sequence[Tuple[str, Callable[[], None]]]
+) -> None:
+    """Show progress while running a sequence of named steps."""
+    if not _should_show_progress(len(steps)):
+        # A live bar costs more than it shows for a few steps
+        for step, run in steps:
+            console.print(f"[info]{step}[/info]")
+            run()
+        return
 
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
-def show_progress_with_steps(message: str, steps: List[str]) -> None:
-    """Show progress with multiple steps."""
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -582,11 +674,10 @@ def show_progress_with_steps(message: str, steps: List[str]) -> None:
             f"[bold primary]{message}[/bold primary]", total=len(steps)
         )
 
-        for i, step in enumerate(steps):
-            progress.update(
-                task, advance=1, description=f"[bold blue]{step}[/bold blue]"
-            )
-            time.sleep(0.1)  # Simulate work
+        for step, run in steps:
+            progress.update(task, description=f"[bold blue]{step}[/bold blue]")
+            run()
+            progress.advance(task)
 
 
 def show_operation_result(
@@ -594,39 +685,69 @@ def show_operation_result(
 ) -> None:
     """Show operation result with consistent styling."""
     if success:
-        status_icon = "[success]✅[/success]"
+        status_icon = "✅"
         status_style = "success"
         status_text = "Success"
     else:
-        status_icon = "[error]❌[/error]"
+        status_icon = "❌"
         status_style = "error"
         status_text = "Failed"
 
-    result_content = f"{status_icon} [bold]{operation}[/bold]: [bold {status_style}]{status_text}[/bold {status_style}]"
+    # Assembled from styled parts so messages are never parsed as markup
+    result_content = Text.assemble(
+        (status_icon, status_style),
+        " ",
+        (operation, "bold"),
+        ": ",
+        (status_text, f"bold {status_style}"),
+    )
+
+    if not message and not details:
+        console.print(result_content)
+        return
 
     if message:
-        result_content += f"\n{message}"
+        result_content.append(f"\n{message}")
 
     if details:
-        result_content += f"\n[dim]{details}[/dim]"
+        result_content.append(f"\n{details}", style="dim")
 
     console.print(Panel(result_content, box=box.ROUNDED, border_style=status_style))
 
 
-def show_banner() -> None:
-    """Show application banner."""
-    banner_text = """
+@functools.cache
+def _create_profile_header() -> Panel:
+    """Build the static create-profile header once."""
+    return Panel.fit(
+        Text.from_markup("[bold green]Create New Profile[/bold green]"),
+        box=box.ROUNDED,
+    )
+
+
+_BANNER_ART = """
     ╔══════════════════════════════════════════════════════════════════════════════╗
     ║                          Claude Code Environment Manager                         ║
     ║                     Professional Environment Configuration Tool                     ║
     ╚══════════════════════════════════════════════════════════════════════════════╝
     """
 
+
+@functools.cache
+def _banner_text() -> Text:
+    """Build the static part of the application banner once."""
+    return Text(_BANNER_ART)
+
+
+def show_banner() -> None:
+    """Show application banner."""
     # Get current time for dynamic content
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = _format_time(datetime.now())
+
+    banner_text = _banner_text().copy()
+    banner_text.append(f"\nStarted at {current_time}", style="dim")
 
     banner_content = Panel(
-        f"{banner_text}\n[dim]Started at {current_time}[/dim]",
+        banner_text,
         style="bold blue",
         box=box.ROUNDED,
         border_style="blue",
@@ -634,24 +755,49 @@ def show_banner() -> None:
     console.print(banner_content)
 
 
-def show_help_tui() -> None:
-    """Show comprehensive help information."""
+# Rows of the help tables
+_HELP_COMMANDS = (
+    ("list/ls", "List all environment profiles", "claude-env-manager list"),
+    ("create", "Create a new environment profile", "claude-env-manager create -i"),
+    ("update", "Update an existing profile", "claude-env-manager update dev -i"),
+    ("delete", "Delete a profile", "claude-env-manager delete old"),
+    ("apply", "Apply a profile to Claude Code", "claude-env-manager apply dev"),
+    ("show", "Show profile details", "claude-env-manager show dev"),
+    ("current", "Show current active profile", "claude-env-manager current"),
+    ("default", "Set default profile", "claude-env-manager default dev"),
+    ("config", "Show configuration info", "claude-env-manager config -v"),
+    ("init", "Initialize configuration", "claude-env-manager init"),
+)
+
+_HELP_OPTIONS = (
+    ("-c, --config FILE", "Specify configuration file path"),
+    ("-s, --settings FILE", "Specify settings file path"),
+    ("-v, --verbose", "Enable verbose output"),
+    ("-q, --quiet", "Quiet mode (minimal output)"),
+    ("-i, --interactive", "Interactive mode"),
+    ("-f, --format FORMAT", "Output format (table, json, yaml)"),
+    ("-n, --name NAME", "Profile name"),
+    ("-f, --force", "Force operation without confirmation"),
+)
+
+
+@functools.cache
+def _help_sections() -> tuple:
+    """Build the static help panels and tables once."""
     help_panel = Panel(
-        "[bold blue]Claude Code Environment Manager[/bold blue]\n"
-        "[dim]Manage Claude Code environment configurations with ease[/dim]",
+        Text.from_markup(
+            "[bold blue]Claude Code Environment Manager[/bold blue]\n"
+            "[dim]Manage Claude Code environment configurations with ease[/dim]"
+        ),
         box=box.ROUNDED,
         border_style="blue",
     )
-    console.print(help_panel)
 
     # Commands section
-    console.print()
-    console.print(
-        Panel(
-            "[bold cyan]Available Commands[/bold cyan]",
-            box=box.ROUNDED,
-            border_style="cyan",
-        )
+    commands_panel = Panel(
+        Text.from_markup("[bold cyan]Available Commands[/bold cyan]"),
+        box=box.ROUNDED,
+        border_style="cyan",
     )
 
     commands_table = Table(box=box.ROUNDED, expand=True)
@@ -659,57 +805,63 @@ def show_help_tui() -> None:
     commands_table.add_column("Description", style="green", width=45)
     commands_table.add_column("Example", style="dim", width=30)
 
-    commands = [
-        ("list/ls", "List all environment profiles", "claude-env-manager list"),
-        ("create", "Create a new environment profile", "claude-env-manager create -i"),
-        ("update", "Update an existing profile", "claude-env-manager update dev -i"),
-        ("delete", "Delete a profile", "claude-env-manager delete old"),
-        ("apply", "Apply a profile to Claude Code", "claude-env-manager apply dev"),
-        ("show", "Show profile details", "claude-env-manager show dev"),
-        ("current", "Show current active profile", "claude-env-manager current"),
-        ("default", "Set default profile", "claude-env-manager default dev"),
-        ("config", "Show configuration info", "claude-env-manager config -v"),
-        ("init", "Initialize configuration", "claude-env-manager init"),
-    ]
-
-    for cmd, desc, example in commands:
+    for cmd, desc, example in _HELP_COMMANDS:
         commands_table.add_row(f"[cyan]{cmd}[/]", desc, f"[dim]{example}[/]")
 
-    console.print(commands_table)
-
     # Options section
-    console.print()
-    console.print(
-        Panel(
-            "[bold yellow]Common Options[/bold yellow]",
-            box=box.ROUNDED,
-            border_style="yellow",
-        )
+    options_panel = Panel(
+        Text.from_markup("[bold yellow]Common Options[/bold yellow]"),
+        box=box.ROUNDED,
+        border_style="yellow",
     )
 
     options_table = Table(box=box.ROUNDED, expand=True)
     options_table.add_column("Option", style="cyan", width=20)
     options_table.add_column("Description", style="green", width=60)
 
-    options = [
-        ("-c, --config FILE", "Specify configuration file path"),
-        ("-s, --settings FILE", "Specify settings file path"),
-        ("-v, --verbose", "Enable verbose output"),
-        ("-q, --quiet", "Quiet mode (minimal output)"),
-        ("-i, --interactive", "Interactive mode"),
-        ("-f, --format FORMAT", "Output format (table, json, yaml)"),
-        ("-n, --name NAME", "Profile name"),
-        ("-f, --force", "Force operation without confirmation"),
-    ]
-
-    for opt, desc in options:
+    for opt, desc in _HELP_OPTIONS:
         options_table.add_row(f"[cyan]{opt}[/]", desc)
 
+    # Footer
+    footer_panel = Panel(
+        Text.from_markup(
+            "[dim]Use 'claude-env-manager <command> --help'"
+            " for detailed command help[/dim]"
+        ),
+        box=box.ROUNDED,
+        border_style="muted",
+    )
+
+    return (
+        help_panel,
+        commands_panel,
+        commands_table,
+        options_panel,
+        options_table,
+        footer_panel,
+    )
+
+
+def show_help_tui() -> None:
+    """Show comprehensive help information."""
+    (
+        help_panel,
+        commands_panel,
+        commands_table,
+        options_panel,
+        options_table,
+        footer_panel,
+    ) = _help_sections()
+
+    console.print(help_panel)
+
+    console.print()
+    console.print(commands_panel)
+    console.print(commands_table)
+
+    console.print()
+    console.print(options_panel)
     console.print(options_table)
 
-    # Footer
     console.print()
-    footer_content = (
-        "[dim]Use 'claude-env-manager <command> --help' for detailed command help[/dim]"
-    )
-    console.print(Panel(footer_content, box=box.ROUNDED, border_style="muted"))
+    console.print(footer_panel)
@@ -1,17 +1,19 @@
 """Main entry point for Claude Code Environment Manager."""
 
 import sys
-from pathlib import Path
 
 # Third-party imports
 import click
 
-# Add src to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Only a script run straight from a checkout needs src on the path; the
+# installed package and `python -m` runs resolve imports normally
+if not __package__:
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Local imports
 from claude_env_manager.cli.commands import cli
-from claude_env_manager.cli.interface import show_banner
 from claude_env_manager.exceptions import ConfigurationError
 from claude_env_manager.utils.config import (
     check_python_version,
@@ -35,6 +37,8 @@ def main() -> None:
 
         # Show banner for interactive commands
         if len(sys.argv) > 1 and sys.argv[1] not in ["-h", "--help", "--version", "-V"]:
+            from claude_env_manager.cli.interface import show_banner
+
             show_banner()
 
         # Run CLI
@@ -1,13 +1,27 @@
 """Data models for Claude Code Environment Manager."""
 
 import re
-import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+# Environment variables every profile must define
+REQUIRED_ENV_VARS = (
+    "ANTHROPIC_BASE_URL",
+    "ANTHROPIC_API_KEY",
+    "ANTHROPIC_MODEL",
+    "ANTHROPIC_SMALL_FAST_MODEL",
+)
+_REQUIRED_ENV_SET = frozenset(REQUIRED_ENV_VARS)
 
-@dataclass
+# Keys a settings permissions block must define
+_PERMISSION_KEYS = frozenset({"allow", "deny"})
+
+# Characters allowed in model names
+_MODEL_NAME_RE = re.compile(r"[a-zA-Z0-9_.\-/]+")
+
+
+@dataclass(slots=True)
 class EnvironmentProfile:
     """Environment profile data model."""
 
@@ -19,42 +33,48 @@ class EnvironmentProfile:
 
     def __post_init__(self) -> None:
         """Validate profile data."""
+        self.validate()
+
+    def validate(self) -> None:
+        """Check the profile fields, raising ValueError if any is invalid."""
         if not self.name:
             raise ValueError("Profile name is required")
 
-        # Ensure required environment variables are present
-        required_vars = [
-            "ANTHROPIC_BASE_URL",
-            "ANTHROPIC_API_KEY",
-            "ANTHROPIC_MODEL",
-            "ANTHROPIC_SMALL_FAST_MODEL",
-        ]
+        env = self.env
 
-        for var in required_vars:
-            if var not in self.env:
-                raise ValueError(f"Required environment variable '{var}' is missing")
+        # Ensure required environment variables are present; the set check
+        # covers the common case, the loop reports the first missing one
+        if not env.keys() >= _REQUIRED_ENV_SET:
+            for var in REQUIRED_ENV_VARS:
+                if var not in env:
+                    raise ValueError(
+                        f"Required environment variable '{var}' is missing"
+                    )
 
         # Validate API key format
-        api_key = self.env.get("ANTHROPIC_API_KEY", "")
-        if not api_key.startswith("sk-"):
+        if not self.has_valid_api_key:
             raise ValueError("API key must start with 'sk-'")
 
         # Validate URL format
-        base_url = self.env.get("ANTHROPIC_BASE_URL", "")
-        if not base_url.startswith(("http://", "https://")):
+        if not env["ANTHROPIC_BASE_URL"].startswith(("http://", "https://")):
             raise ValueError("Base URL must start with 'http://' or 'https://'")
 
-        # Validate model names
-        model = self.env.get("ANTHROPIC_MODEL", "")
-        fast_model = self.env.get("ANTHROPIC_SMALL_FAST_MODEL", "")
-
         # Validate model names format
-        for model_name in [model, fast_model]:
-            if model_name and not re.match(r"^[a-zA-Z0-9_.\-/]+$", model_name):
+        for model_name in (env["ANTHROPIC_MODEL"], env["ANTHROPIC_SMALL_FAST_MODEL"]):
+            if model_name and not _MODEL_NAME_RE.fullmatch(model_name):
                 raise ValueError("Invalid model name format")
 
+    @property
+    def has_valid_api_key(self) -> bool:
+        """Whether the API key has the expected 'sk-' format."""
+        return self.env.get("ANTHROPIC_API_KEY", "").startswith("sk-")
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert profile to dictionary for serialization."""
+        """Convert profile to a dictionary of plain strings for serialization.
+
+        Keeping the output to str/dict/None lets the C-backed safe YAML dumper
+        and orjson serialize it without any custom representers.
+        """
         return {
             "name": self.name,
             "env": self.env,
@@ -66,29 +86,30 @@ class EnvironmentProfile:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EnvironmentProfile":
         """Create profile from dictionary."""
-        profile_data = data.copy()
-
-        # Parse datetime fields
-        if "created" in profile_data:
-            profile_data["created"] = datetime.fromisoformat(profile_data["created"])
-        if "modified" in profile_data:
-            profile_data["modified"] = datetime.fromisoformat(profile_data["modified"])
-
-        return cls(**profile_data)
+        # Timestamps may already be datetimes (e.g. unquoted YAML timestamps)
+        created = data.get("created")
+        if isinstance(created, str):
+            created = datetime.fromisoformat(created)
+        modified = data.get("modified")
+        if isinstance(modified, str):
+            modified = datetime.fromisoformat(modified)
+
+        return cls(
+            name=data["name"],
+            env=data["env"],
+            description=data.get("description"),
+            created=created or datetime.now(),
+            modified=modified or datetime.now(),
+        )
 
     def update_env(self, env_vars: Dict[str, str]) -> None:
         """Update environment variables and mark as modified."""
         self.env.update(env_vars)
-        # Ensure timestamp is different by adding a small delay if needed
-        new_time = datetime.now()
-        if new_time <= self.modified:
-            time.sleep(0.001)  # 1ms delay
-            self.modified = datetime.now()
-        else:
-            self.modified = new_time
+        # Keep the timestamp strictly increasing without sleeping on coarse clocks
+        self.modified = max(datetime.now(), self.modified + timedelta(microseconds=1))
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeSettings:
     """Claude Code settings data model."""
 
@@ -102,7 +123,7 @@ class ClaudeSettings:
         if not self.env:
             raise ValueError("Environment variables are required")
 
-        if "allow" not in self.permissions or "deny" not in self.permissions:
+        if not self.permissions.keys() >= _PERMISSION_KEYS:
             raise ValueError(
                 "Permissions dictionary must contain 'allow' and 'deny' keys"
             )
@@ -139,12 +160,28 @@ class ClaudeSettings:
         self.env.update(env_vars)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileConfig:
-    """Configuration file data model."""
+    """Configuration file data model.
+
+    Profiles are indexed by name (and lazily by model) for O(1) lookups, so
+    profiles should be changed through add_profile/remove_profile/update_profile
+    rather than mutated directly.
+    """
 
     profiles: List[EnvironmentProfile] = field(default_factory=list)
     default_profile: Optional[str] = None
+    _by_name: Dict[str, EnvironmentProfile] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_model: Optional[Dict[Optional[str], EnvironmentProfile]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the name index; the first profile wins on duplicate names."""
+        for profile in self.profiles:
+            self._by_name.setdefault(profile.name, profile)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for YAML serialization."""
@@ -166,31 +203,47 @@ class ProfileConfig:
 
     def get_profile(self, name: str) -> Optional[EnvironmentProfile]:
         """Get a profile by name."""
-        for profile in self.profiles:
-            if profile.name == name:
-                return profile
-        return None
+        return self._by_name.get(name)
+
+    def find_by_model(self, model: Optional[str]) -> Optional[EnvironmentProfile]:
+        """Get the first profile whose ANTHROPIC_MODEL matches."""
+        if self._by_model is None:
+            self._by_model = {}
+            for profile in self.profiles:
+                self._by_model.setdefault(profile.env.get("ANTHROPIC_MODEL"), profile)
+        return self._by_model.get(model)
 
     def add_profile(self, profile: EnvironmentProfile) -> None:
         """Add a new profile."""
         # Check if profile already exists
-        if self.get_profile(profile.name):
+        if profile.name in self._by_name:
             raise ValueError(f"Profile '{profile.name}' already exists")
 
         self.profiles.append(profile)
+        self._by_name[profile.name] = profile
+        self._by_model = None
 
     def remove_profile(self, name: str) -> bool:
         """Remove a profile by name. Returns True if removed, False if not found."""
-        for i, profile in enumerate(self.profiles):
-            if profile.name == name:
-                del self.profiles[i]
-                # Update default profile if it was the removed one
-                if self.default_profile == name:
-                    self.default_profile = (
-                        self.profiles[0].name if self.profiles else None
-                    )
-                return True
-        return False
+        profile = self._by_name.pop(name, None)
+        if profile is None:
+            return False
+
+        # Match by identity: list.remove would call the dataclass __eq__ on
+        # every profile before this one
+        profiles = self.profiles
+        index = next(i for i, p in enumerate(profiles) if p is profile)
+        del profiles[index]
+        # A later profile with the same name now answers lookups for it
+        for duplicate in profiles[index:]:
+            if duplicate.name == name:
+                self._by_name[name] = duplicate
+                break
+        self._by_model = None
+        # Update default profile if it was the removed one
+        if self.default_profile == name:
+            self.default_profile = self.profiles[0].name if self.profiles else None
+        return True
 
     def update_profile(self, name: str, **kwargs) -> Optional[EnvironmentProfile]:
         """Update a profile by name. Returns updated profile or None if not found."""
@@ -201,6 +254,7 @@ class ProfileConfig:
         # Update fields
         if "env" in kwargs:
             profile.update_env(kwargs["env"])
+            self._by_model = None
         if "description" in kwargs:
             profile.description = kwargs["description"]
 
@@ -6,9 +6,19 @@ Intensive Learning Path - Day 1 Implementation
 
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.table import Table
+# Rich is imported only by the commands that render with it, so --help and
+# usage errors skip its import cost
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Markup for each known environment status
+_STATUS_STYLES = {
+    "✓ Active": "[green]✓ Active[/]",
+    "● Testing": "[yellow]● Testing[/]",
+    "◉ Staging": "[blue]◉ Staging[/]",
+}
 
 
 def create_parser():
@@ -33,8 +43,10 @@ def create_parser():
     return parser
 
 
-def cmd_list(args, console: Console):
+def cmd_list(args, console: "Console"):
     """Handle the list command with beautiful Rich table"""
+    from rich.table import Table
+
     # Create a Rich table
     table = Table(title="🌐 Claude Environments")
 
@@ -60,16 +72,8 @@ def cmd_list(args, console: Console):
 
     # Add rows with colored status
     for env in environments:
-        if "✓ Active" in env["status"]:
-            status_style = "[green]✓ Active[/]"
-        elif "● Testing" in env["status"]:
-            status_style = "[yellow]● Testing[/]"
-        elif "◉ Staging" in env["status"]:
-            status_style = "[blue]◉ Staging[/]"
-        else:
-            status_style = env["status"]
-
-        table.add_row(env["name"], env["url"], status_style)
+        status = env["status"]
+        table.add_row(env["name"], env["url"], _STATUS_STYLES.get(status, status))
 
     console.print(table)
 
@@ -79,13 +83,13 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
 
-    console = Console()
-
     if args.command == "list":
-        cmd_list(args, console)
+        from rich.console import Console
+
+        cmd_list(args, Console())
     else:
-        console.print("[bold red]Error:[/] Please specify a command")
-        console.print("Use [yellow]--help[/] for available commands")
+        print("Error: Please specify a command", file=sys.stderr)
+        print("Use --help for available commands", file=sys.stderr)
         parser.print_help()
         sys.exit(1)
 
@@ -1,21 +1,21 @@
 """Configuration utilities for Claude Code Environment Manager."""
 
+import functools
 import os
+import platform
+import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 
-
 def get_default_config_path() -> Path:
     """Get the default configuration file path."""
-    home = Path.home()
-    return home / ".claude" / "claude-profiles.yml"
+    return get_claude_config_dir() / "claude-profiles.json"
 
 
 def get_default_settings_path() -> Path:
     """Get the default Claude Code settings file path."""
-    home = Path.home()
-    return home / ".claude" / "settings.json"
+    return get_claude_config_dir() / "settings.json"
 
 
 def get_config_path_from_env() -> Optional[Path]:
@@ -74,14 +74,16 @@ def ensure_settings_directory(settings_path: Path) -> None:
     settings_dir.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_home_dir() -> Path:
-    """Get the user's home directory."""
+    """Get the user's home directory, resolved once per process."""
     return Path.home()
 
 
+@functools.lru_cache(maxsize=1)
 def get_claude_config_dir() -> Path:
     """Get the Claude Code configuration directory."""
-    return Path.home() / ".claude"
+    return get_user_home_dir() / ".claude"
 
 
 def is_claude_installed() -> bool:
@@ -109,11 +111,11 @@ def get_default_permissions() -> Dict[str, list]:
 def get_default_status_line() -> Dict[str, Any]:
     """Get default status line configuration."""
     # Platform-specific command path
-    home = Path.home()
+    ccline_dir = get_claude_config_dir() / "ccline"
     if os.name == "nt":  # Windows
-        command = str(home / ".claude" / "ccline" / "ccline.exe")
+        command = str(ccline_dir / "ccline.exe")
     else:  # Unix-like
-        command = str(home / ".claude" / "ccline" / "ccline")
+        command = str(ccline_dir / "ccline")
 
     return {"type": "command", "command": command, "padding": 0}
 
@@ -174,8 +176,6 @@ def get_required_python_version() -> tuple:
 
 def check_python_version() -> bool:
     """Check if the current Python version meets requirements."""
-    import sys
-
     current_version = sys.version_info[:2]
     required_version = get_required_python_version()
 
@@ -184,15 +184,12 @@ def check_python_version() -> bool:
 
 def get_system_info() -> Dict[str, str]:
     """Get system information for debugging."""
-    import platform
-    import sys
-
     return {
         "python_version": sys.version,
         "platform": platform.platform(),
         "system": platform.system(),
         "architecture": platform.machine(),
-        "home_directory": str(Path.home()),
+        "home_directory": str(get_user_home_dir()),
         "claude_config_dir": str(get_claude_config_dir()),
         "claude_installed": str(is_claude_installed()),
     }
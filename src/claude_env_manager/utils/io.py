@@ -1,8 +1,11 @@
 """File I/O utilities for Claude Code Environment Manager."""
 
+import os
 import shutil
+import stat
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from ..exceptions import FileOperationError
 
@@ -10,27 +13,74 @@ from ..exceptions import FileOperationError
 def safe_read_file(file_path: Path) -> Optional[str]:
     """Safely read a file and return its contents."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        # One binary read and decode; normalize newlines as text mode would
+        with open(file_path, "rb") as f:
+            data = f.read().decode("utf-8")
     except FileNotFoundError:
         return None
     except Exception as e:
         raise FileOperationError(f"Failed to read file {file_path}: {e}")
 
+    if "\r" in data:
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    return data
 
-def safe_write_file(file_path: Path, content: str) -> None:
-    """Safely write content to a file."""
+
+def _new_file_mode() -> int:
+    """Get the mode open() would give a new file under the current umask."""
+    # The umask can only be read by setting it, so restore it straight away
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Reading the umask briefly changes it for the whole process, which would race
+# with other threads creating files, so it is read once at import
+_NEW_FILE_MODE = _new_file_mode()
+
+
+def safe_write_file(file_path: Path, content: Union[str, bytes]) -> None:
+    """Atomically write content to a file.
+
+    The data goes to a uniquely named temporary file in the same directory,
+    is flushed to disk and then renamed over the target with os.replace, so
+    readers never see a partially written file. ``str`` content is encoded as
+    UTF-8; ``bytes`` are written as is. An existing file keeps its mode; a new
+    file gets the mode derived from the umask at import rather than mkstemp's
+    0600.
+    """
     try:
         # Create parent directory if it doesn't exist
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temporary file first
-        temp_file = file_path.with_suffix(file_path.suffix + ".tmp")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        # Replace the original file
-        temp_file.replace(file_path)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+
+        # Write to a temporary file in the same directory first
+        fd, temp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+        )
+        try:
+            # Write the raw fd directly; a buffered file object adds nothing
+            # for a single write of known size
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = _NEW_FILE_MODE
+            os.chmod(temp_name, mode)
+
+            # Replace the original file
+            os.replace(temp_name, file_path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
 
     except Exception as e:
         raise FileOperationError(f"Failed to write file {file_path}: {e}")
@@ -95,7 +145,8 @@ def set_file_permissions(file_path: Path, permissions: int) -> None:
 def is_file_writable(file_path: Path) -> bool:
     """Check if a file is writable."""
     try:
-        return file_path.exists() and file_path.stat().st_mode & 0o200
+        # A single stat; a missing file raises instead of needing exists()
+        return bool(file_path.stat().st_mode & stat.S_IWUSR)
     except Exception:
         return False
 
@@ -5,6 +5,19 @@ from typing import Any, Dict
 from urllib.parse import urlparse
 
 from ..exceptions import ValidationError
+from ..models import REQUIRED_ENV_VARS
+
+# Compiled once at import instead of going through re's cache on every call
+_PROFILE_NAME_RE = re.compile(r"[a-zA-Z0-9_-]+")
+# Allowed characters that also neither start nor end with '-' or '_'
+_VALID_PROFILE_NAME_RE = re.compile(r"[a-zA-Z0-9](?:[a-zA-Z0-9_-]*[a-zA-Z0-9])?")
+_MODEL_NAME_RE = re.compile(r"[a-zA-Z0-9_.\-/]+")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+# Distinguishes a missing key from one explicitly set to None
+_MISSING = object()
+
+_HTTP_SCHEMES = frozenset({"http", "https"})
 
 
 def validate_profile_name(name: str) -> None:
@@ -15,8 +28,12 @@ def validate_profile_name(name: str) -> None:
     if len(name) > 50:
         raise ValidationError("Profile name must be 50 characters or less")
 
+    # Valid names pass a single match; the checks below only pick the message
+    if _VALID_PROFILE_NAME_RE.fullmatch(name):
+        return
+
     # Only allow alphanumeric characters, hyphens, and underscores
-    if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+    if not _PROFILE_NAME_RE.fullmatch(name):
         raise ValidationError(
             "Profile name can only contain letters, numbers, hyphens, and underscores"
         )
@@ -39,23 +56,12 @@ def validate_environment_vars(env_vars: Dict[str, str], partial: bool = False) -
             if not value:
                 raise ValidationError(f"Environment variable '{var}' cannot be empty")
             # Validate specific variables if they are provided
-            if var == "ANTHROPIC_API_KEY":
-                validate_api_key(value)
-            elif var == "ANTHROPIC_BASE_URL":
-                validate_base_url(value)
-            elif var in ("ANTHROPIC_MODEL", "ANTHROPIC_SMALL_FAST_MODEL"):
-                validate_model_name(value)
+            validator = _ENV_VAR_VALIDATORS.get(var)
+            if validator is not None:
+                validator(value)
     else:
         # For full profile creation, validate all required variables
-        required_vars = [
-            "ANTHROPIC_BASE_URL",
-            "ANTHROPIC_API_KEY",
-            "ANTHROPIC_MODEL",
-            "ANTHROPIC_SMALL_FAST_MODEL",
-        ]
-
-        # Check required variables
-        for var in required_vars:
+        for var in REQUIRED_ENV_VARS:
             if var not in env_vars:
                 raise ValidationError(
                     f"Required environment variable '{var}' is missing"
@@ -63,11 +69,9 @@ def validate_environment_vars(env_vars: Dict[str, str], partial: bool = False) -
             if not env_vars[var]:
                 raise ValidationError(f"Environment variable '{var}' cannot be empty")
 
-        # Validate specific variables
-        validate_api_key(env_vars.get("ANTHROPIC_API_KEY", ""))
-        validate_base_url(env_vars.get("ANTHROPIC_BASE_URL", ""))
-        validate_model_name(env_vars.get("ANTHROPIC_MODEL", ""))
-        validate_model_name(env_vars.get("ANTHROPIC_SMALL_FAST_MODEL", ""))
+        # Validate specific variables; all of them are known to be present
+        for var, validator in _ENV_VAR_VALIDATORS.items():
+            validator(env_vars[var])
 
 
 def validate_api_key(api_key: str) -> None:
@@ -91,19 +95,15 @@ def validate_base_url(url: str) -> None:
 
     try:
         parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ValidationError("Base URL must be a valid URL")
-
-        if parsed.scheme not in ("http", "https"):
-            raise ValidationError("Base URL must use HTTP or HTTPS protocol")
+    except ValueError as e:
+        raise ValidationError(f"Invalid base URL: {e}")
 
-        # Accept any valid base URL
-        # Note: Removed restriction to anthropic.com or localhost only
+    if not parsed.scheme or not parsed.netloc:
+        raise ValidationError("Base URL must be a valid URL")
 
-    except Exception as e:
-        if "must be a valid URL" in str(e):
-            raise ValidationError("Base URL must be a valid URL")
-        raise ValidationError(f"Invalid base URL: {e}")
+    # Accept any valid base URL (no restriction to anthropic.com or localhost)
+    if parsed.scheme not in _HTTP_SCHEMES:
+        raise ValidationError("Base URL must use HTTP or HTTPS protocol")
 
 
 def validate_model_name(model: str) -> None:
@@ -115,10 +115,19 @@ def validate_model_name(model: str) -> None:
     # Basic validation: should contain at least one character and can include slashes, dots, hyphens,
     # underscores
     # Exclude special characters like @, #, etc.
-    if not re.match(r"^[a-zA-Z0-9_.\-/]+$", model):
+    if not _MODEL_NAME_RE.fullmatch(model):
         raise ValidationError("Invalid model name format")
 
 
+# Validators for the env vars that have format rules
+_ENV_VAR_VALIDATORS = {
+    "ANTHROPIC_API_KEY": validate_api_key,
+    "ANTHROPIC_BASE_URL": validate_base_url,
+    "ANTHROPIC_MODEL": validate_model_name,
+    "ANTHROPIC_SMALL_FAST_MODEL": validate_model_name,
+}
+
+
 def validate_description(description: str) -> None:
     """Validate profile description."""
     if description is None:
@@ -133,26 +142,28 @@ def validate_config_data(data: Dict[str, Any]) -> None:
     if not isinstance(data, dict):
         raise ValidationError("Configuration must be a dictionary")
 
-    if "profiles" in data:
-        if not isinstance(data["profiles"], list):
+    profiles = data.get("profiles", _MISSING)
+    if profiles is not _MISSING:
+        if not isinstance(profiles, list):
             raise ValidationError("Profiles must be a list")
 
-        for profile in data["profiles"]:
+        for profile in profiles:
             if not isinstance(profile, dict):
                 raise ValidationError("Each profile must be a dictionary")
 
             if "name" not in profile:
                 raise ValidationError("Profile must have a name")
 
-            if "env" not in profile:
+            env = profile.get("env", _MISSING)
+            if env is _MISSING:
                 raise ValidationError("Profile must have environment variables")
 
-            if not isinstance(profile["env"], dict):
+            if not isinstance(env, dict):
                 raise ValidationError("Environment variables must be a dictionary")
 
-    if "default_profile" in data and data["default_profile"]:
-        if not isinstance(data["default_profile"], str):
-            raise ValidationError("Default profile must be a string")
+    default_profile = data.get("default_profile")
+    if default_profile and not isinstance(default_profile, str):
+        raise ValidationError("Default profile must be a string")
 
 
 def validate_settings_data(data: Dict[str, Any]) -> None:
@@ -179,26 +190,26 @@ def validate_settings_data(data: Dict[str, Any]) -> None:
         raise ValidationError("Status line must be a dictionary")
 
 
+# Characters and (case-insensitive) names that are unsafe in filenames
+_UNSAFE_FILENAME_CHARS = frozenset('/\\:*?"<>|')
+_RESERVED_FILENAMES = frozenset(
+    ["con", "prn", "aux", "nul"]
+    + [f"com{i}" for i in range(1, 10)]
+    + [f"lpt{i}" for i in range(1, 10)]
+)
+
+
 def is_safe_filename(filename: str) -> bool:
     """Check if filename is safe."""
     if not filename:
         return False
 
     # Check for unsafe characters
-    unsafe_chars = ["/", "\\", ":", "*", "?", '"', "<", ">", "|"]
-    if any(char in filename for char in unsafe_chars):
+    if not _UNSAFE_FILENAME_CHARS.isdisjoint(filename):
         return False
 
     # Check for reserved filenames
-    reserved_names = (
-        ["con", "prn", "aux", "nul"]
-        + [f"com{i}" for i in range(1, 10)]
-        + [f"lpt{i}" for i in range(1, 10)]
-    )
-    if filename.lower() in reserved_names:
-        return False
-
-    return True
+    return filename.lower() not in _RESERVED_FILENAMES
 
 
 def sanitize_string(value: str, max_length: int = None) -> str:
@@ -207,7 +218,7 @@ def sanitize_string(value: str, max_length: int = None) -> str:
         return ""
 
     # Remove null bytes and control characters
-    value = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", value)
+    value = _CONTROL_CHARS_RE.sub("", value)
 
     # Strip whitespace
     value = value.strip()
@@ -0,0 +1,195 @@
+"""Shared pytest fixtures for the Claude Code Environment Manager tests."""
+
+import ast
+import inspect
+import itertools
+import json
+import textwrap
+import warnings
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import MappingProxyType
+
+import pytest
+import yaml
+
+from claude_env_manager import models
+from claude_env_manager.api import ClaudeEnvManager
+from claude_env_manager.models import ClaudeSettings, EnvironmentProfile, ProfileConfig
+
+# Fixed timestamp for fixture profiles, so they never depend on the clock
+FIXED_TIME = datetime(2024, 1, 1)
+
+# More test functions than this sharing one body should be parametrized
+_MAX_DUPLICATE_BODIES = 3
+
+
+def pytest_addoption(parser):
+    """Register the opt-in duplicate test body check."""
+    parser.addoption(
+        "--warn-duplicate-tests",
+        action="store_true",
+        help="warn when many test functions share an identical body",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """With --warn-duplicate-tests, warn about copy-pasted test bodies."""
+    if not config.getoption("--warn-duplicate-tests"):
+        return
+
+    by_body = defaultdict(set)
+    # Parametrized items share one function; parse each function only once
+    functions = {getattr(item, "function", None) for item in items}
+    functions.discard(None)
+    for function in functions:
+        try:
+            source = inspect.getsource(function)
+        except (OSError, TypeError):
+            # No source to compare, e.g. for functions built at runtime
+            continue
+        body = ast.parse(textwrap.dedent(source)).body[0].body
+        # Ignore the docstring, which usually differs between copies
+        if ast.get_docstring(ast.Module(body=body, type_ignores=[])) is not None:
+            body = body[1:]
+        by_body[ast.dump(ast.Module(body=body, type_ignores=[]))].add(
+            f"{function.__module__}.{function.__qualname__}"
+        )
+
+    for names in by_body.values():
+        if len(names) > _MAX_DUPLICATE_BODIES:
+            warnings.warn(
+                pytest.PytestWarning(
+                    f"{len(names)} tests share an identical body, parametrize them: "
+                    + ", ".join(sorted(names))
+                )
+            )
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Make models' datetime.now() tick one second per call; returns the start time."""
+    ticks = itertools.count(1)
+
+    class _FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return FIXED_TIME + timedelta(seconds=next(ticks))
+
+    monkeypatch.setattr(models, "datetime", _FakeDatetime)
+    return FIXED_TIME
+
+
+@pytest.fixture(scope="session")
+def anthropic_env():
+    """The four required Anthropic variables, read-only; copy before mutating."""
+    return MappingProxyType(
+        {
+            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
+            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
+            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
+            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307",
+        }
+    )
+
+
+@pytest.fixture
+def env_vars(anthropic_env):
+    """A fresh, mutable copy of the standard Anthropic variables."""
+    return dict(anthropic_env)
+
+
+@pytest.fixture(scope="session")
+def base_permissions():
+    """Empty allow/deny permissions, read-only; copy before mutating."""
+    return MappingProxyType({"allow": [], "deny": []})
+
+
+@pytest.fixture(scope="session")
+def base_status_line():
+    """The ccline command status line, read-only; copy before mutating."""
+    return MappingProxyType(
+        {"type": "command", "command": "/path/to/ccline", "padding": 0}
+    )
+
+
+@pytest.fixture(scope="session")
+def profiles_yaml(anthropic_env):
+    """A YAML config holding 'test-profile' as its default, serialized once."""
+    return yaml.safe_dump(
+        {
+            "profiles": [
+                {
+                    "name": "test-profile",
+                    "env": dict(anthropic_env),
+                    "description": "Test profile",
+                    "created": "2024-01-01T00:00:00Z",
+                    "modified": "2024-01-01T00:00:00Z",
+                }
+            ],
+            "default_profile": "test-profile",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def settings_json(anthropic_env, base_permissions, base_status_line):
+    """A settings file with the standard env, serialized once."""
+    return json.dumps(
+        {
+            "env": dict(anthropic_env),
+            "permissions": dict(base_permissions),
+            "statusLine": dict(base_status_line),
+            "$schema": "https://json.schemastore.org/claude-code-settings.json",
+        }
+    )
+
+
+@pytest.fixture
+def make_profile(anthropic_env):
+    """Factory for profiles with the standard env and fixed timestamps."""
+
+    def _make(name="test-profile", env=None, description="Test profile"):
+        return EnvironmentProfile(
+            name=name,
+            env=dict(anthropic_env if env is None else env),
+            description=description,
+            created=FIXED_TIME,
+            modified=FIXED_TIME,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def sample_profile(make_profile):
+    """A valid profile named 'test-profile' with its own copy of the env."""
+    return make_profile(description=None)
+
+
+@pytest.fixture
+def sample_config(make_profile):
+    """A config holding 'test-profile' as its default."""
+    return ProfileConfig(profiles=[make_profile()], default_profile="test-profile")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A manager whose config and settings files live in the test's tmp_path."""
+    return ClaudeEnvManager(
+        str(tmp_path / "claude-profiles.json"), str(tmp_path / "settings.json")
+    )
+
+
+@pytest.fixture
+def make_settings(base_permissions, base_status_line):
+    """Factory for settings with empty permissions and a ccline status line."""
+
+    def _make(env):
+        return ClaudeSettings(
+            env=env,
+            permissions={key: list(value) for key, value in base_permissions.items()},
+            status_line=dict(base_status_line),
+        )
+
+    return _make
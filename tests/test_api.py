@@ -2,21 +2,30 @@
 
 import pytest
 import json
+import os
+import stat
 import yaml
-from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
-from datetime import datetime
 
 from claude_env_manager.api import ClaudeEnvManager
-from claude_env_manager.models import EnvironmentProfile, ProfileConfig, ClaudeSettings
+from claude_env_manager.models import ProfileConfig
+from claude_env_manager.utils import io as io_utils
 from claude_env_manager.exceptions import (
     ProfileNotFoundError,
     ProfileExistsError,
-    InvalidProfileError,
     SettingsFileError,
     ConfigurationError
 )
 
+# Exact error messages, compared directly against the raised exception
+_NOT_FOUND_MSG = "Profile 'non-existent' not found"
+_EXISTS_MSG = "Profile 'test-profile' already exists"
+
+# Custom paths, normalized once for platform-specific path separators
+_CUSTOM_CONFIG_PATH = "/custom/config.yml"
+_CUSTOM_SETTINGS_PATH = "/custom/settings.json"
+_CUSTOM_CONFIG_NORM = os.path.normpath(_CUSTOM_CONFIG_PATH)
+_CUSTOM_SETTINGS_NORM = os.path.normpath(_CUSTOM_SETTINGS_PATH)
+
 
 class TestClaudeEnvManager:
     """Test ClaudeEnvManager API class."""
@@ -25,165 +34,219 @@ class TestClaudeEnvManager:
         """Test initialization with default paths."""
         manager = ClaudeEnvManager()
         
-        assert manager.config_file.name == "claude-profiles.yml"
+        assert manager.config_file.name == "claude-profiles.json"
         assert manager.settings_file.name == "settings.json"
         assert manager._config_cache is None
         assert manager._settings_cache is None
 
     def test_init_with_custom_paths(self):
         """Test initialization with custom paths."""
-        config_path = "/custom/config.yml"
-        settings_path = "/custom/settings.json"
+        manager = ClaudeEnvManager(_CUSTOM_CONFIG_PATH, _CUSTOM_SETTINGS_PATH)
         
-        manager = ClaudeEnvManager(config_path, settings_path)
+        assert str(manager.config_file) == _CUSTOM_CONFIG_NORM
+        assert str(manager.settings_file) == _CUSTOM_SETTINGS_NORM
+
+    def test_load_config_existing_file(self, tmp_path, anthropic_env, profiles_yaml):
+        """Test loading configuration from existing file."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text(profiles_yaml)
         
-        # Use os.path.normpath to handle platform-specific path separators
-        import os
-        expected_config_path = os.path.normpath(config_path)
-        expected_settings_path = os.path.normpath(settings_path)
+        manager = ClaudeEnvManager(str(config_file))
+        config = manager.load_config()
         
-        assert str(manager.config_file) == expected_config_path
-        assert str(manager.settings_file) == expected_settings_path
+        assert len(config.profiles) == 1
+        assert config.profiles[0].name == "test-profile"
+        assert config.profiles[0].env == anthropic_env
+        assert config.profiles[0].description == "Test profile"
+        assert config.default_profile == "test-profile"
+        assert manager._config_cache == config
 
-    @patch('claude_env_manager.api.safe_read_file')
-    @patch('claude_env_manager.api.yaml.safe_load')
-    def test_load_config_existing_file(self, mock_yaml_load, mock_read_file):
-        """Test loading configuration from existing file."""
-        # Setup mocks
-        mock_read_file.return_value = "yaml_content"
-        mock_yaml_load.return_value = {
+    def test_load_config_json_file(self, tmp_path, anthropic_env):
+        """Test loading configuration from a JSON file."""
+        config_file = tmp_path / "claude-profiles.json"
+        config_file.write_text(json.dumps({
             "profiles": [
                 {
                     "name": "test-profile",
-                    "env": {
-                        "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                        "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                        "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                        "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-                    },
+                    "env": dict(anthropic_env),
                     "description": "Test profile",
-                    "created": "2024-01-01T00:00:00Z",
-                    "modified": "2024-01-01T00:00:00Z"
+                    "created": "2024-01-01T00:00:00",
+                    "modified": "2024-01-01T00:00:00"
                 }
             ],
             "default_profile": "test-profile"
-        }
+        }))
         
-        manager = ClaudeEnvManager()
+        manager = ClaudeEnvManager(str(config_file))
         config = manager.load_config()
         
-        assert len(config.profiles) == 1
         assert config.profiles[0].name == "test-profile"
         assert config.default_profile == "test-profile"
-        assert manager._config_cache == config
 
-    @patch('claude_env_manager.api.safe_read_file')
-    def test_load_config_nonexistent_file(self, mock_read_file):
+    def test_load_config_migrates_yaml(self, tmp_path, anthropic_env):
+        """Test that a legacy YAML config is migrated to JSON."""
+        legacy_file = tmp_path / "claude-profiles.yml"
+        legacy_file.write_text(yaml.safe_dump({
+            "profiles": [
+                {
+                    "name": "test-profile",
+                    "env": dict(anthropic_env),
+                    "created": "2024-01-01T00:00:00",
+                    "modified": "2024-01-01T00:00:00"
+                }
+            ],
+            "default_profile": "test-profile"
+        }))
+        config_file = tmp_path / "claude-profiles.json"
+        
+        manager = ClaudeEnvManager(str(config_file))
+        config = manager.load_config()
+        
+        assert config.profiles[0].name == "test-profile"
+        assert config_file.exists()
+        assert json.loads(config_file.read_text())["default_profile"] == "test-profile"
+
+    def test_load_config_rereads_changed_file(self, tmp_path):
+        """Test that a new manager sees changes made to the file on disk."""
+        config_file = tmp_path / "claude-profiles.json"
+        config_file.write_text(json.dumps({"profiles": [], "default_profile": "a"}))
+        
+        config = ClaudeEnvManager(str(config_file)).load_config()
+        assert config.default_profile == "a"
+        
+        config_file.write_text(json.dumps({"profiles": [], "default_profile": "bb"}))
+        config = ClaudeEnvManager(str(config_file)).load_config()
+        assert config.default_profile == "bb"
+
+    def test_load_config_nonexistent_file(self, tmp_path):
         """Test loading configuration when file doesn't exist."""
-        mock_read_file.return_value = None
-        
-        with patch.object(Path, 'exists', return_value=False):
-            manager = ClaudeEnvManager()
-            config = manager.load_config()
-            
-            assert len(config.profiles) == 0
-            assert config.default_profile is None
-
-    @patch('claude_env_manager.api.safe_read_file')
-    @patch('claude_env_manager.api.yaml.safe_load')
-    def test_load_config_invalid_yaml(self, mock_yaml_load, mock_read_file):
+        config_file = tmp_path / "claude-profiles.json"
+        
+        manager = ClaudeEnvManager(str(config_file))
+        config = manager.load_config()
+        
+        assert len(config.profiles) == 0
+        assert config.default_profile is None
+        assert config_file.exists()
+
+    def test_load_config_invalid_yaml(self, tmp_path):
         """Test loading configuration with invalid YAML."""
-        mock_read_file.return_value = "invalid_yaml"
-        mock_yaml_load.side_effect = yaml.YAMLError("Invalid YAML")
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("profiles: [unclosed")
         
-        manager = ClaudeEnvManager()
+        manager = ClaudeEnvManager(str(config_file))
         
         with pytest.raises(ConfigurationError, match="Invalid YAML format"):
             manager.load_config()
 
-    @patch('claude_env_manager.api.safe_write_file')
-    def test_save_config(self, mock_write_file):
+    def test_save_config(self, tmp_path, sample_profile):
         """Test saving configuration."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile], default_profile="test-profile")
+        config = ProfileConfig(
+            profiles=[sample_profile], default_profile="test-profile"
+        )
         
-        manager = ClaudeEnvManager()
+        config_file = tmp_path / "claude-profiles.json"
+        manager = ClaudeEnvManager(str(config_file))
         manager.save_config(config)
         
-        mock_write_file.assert_called_once()
+        assert json.loads(config_file.read_text()) == config.to_dict()
         assert manager._config_cache == config
 
-    @patch('claude_env_manager.api.safe_read_file')
-    @patch('claude_env_manager.api.json.loads')
-    def test_load_settings(self, mock_json_loads, mock_read_file):
-        """Test loading settings."""
-        mock_read_file.return_value = json.dumps({
-            "env": {
-                "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-            },
-            "permissions": {"allow": [], "deny": []},
-            "statusLine": {
-                "type": "command",
-                "command": "/path/to/ccline",
-                "padding": 0
-            },
-            "$schema": "https://json.schemastore.org/claude-code-settings.json"
-        })
-        
-        mock_json_loads.return_value = {
-            "env": {
-                "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-            },
-            "permissions": {"allow": [], "deny": []},
-            "statusLine": {
-                "type": "command",
-                "command": "/path/to/ccline",
-                "padding": 0
-            },
-            "$schema": "https://json.schemastore.org/claude-code-settings.json"
+    def test_save_config_writes_json_atomically(self, tmp_path):
+        """Test that saving writes JSON and leaves no temporary files behind."""
+        config_file = tmp_path / "claude-profiles.json"
+        
+        manager = ClaudeEnvManager(str(config_file))
+        manager.save_config(ProfileConfig(default_profile="test-profile"))
+        
+        assert json.loads(config_file.read_text()) == {
+            "profiles": [],
+            "default_profile": "test-profile",
         }
+        assert [p.name for p in tmp_path.iterdir()] == ["claude-profiles.json"]
+
+    def test_save_config_new_file_uses_umask_mode(self, tmp_path, monkeypatch):
+        """Test that a newly created config file gets the umask-derived mode."""
+        config_file = tmp_path / "claude-profiles.json"
+        monkeypatch.setattr(io_utils, "_NEW_FILE_MODE", 0o640)
+        
+        ClaudeEnvManager(str(config_file)).save_config(ProfileConfig())
         
-        with patch.object(Path, 'exists', return_value=True):
-            manager = ClaudeEnvManager()
-            settings = manager.load_settings()
-            
-            assert settings.env["ANTHROPIC_BASE_URL"] == "https://api.anthropic.com"
-            assert manager._settings_cache == settings
+        assert stat.S_IMODE(config_file.stat().st_mode) == 0o640
 
-    def test_load_settings_nonexistent_file(self):
-        """Test loading settings when file doesn't exist."""
-        with patch.object(Path, 'exists', return_value=False):
-            manager = ClaudeEnvManager()
-            
-            with pytest.raises(SettingsFileError, match="Settings file not found"):
-                manager.load_settings()
+    def test_save_config_writes_yaml_for_yml_path(self, tmp_path):
+        """Test that a .yml config path is saved as YAML."""
+        config_file = tmp_path / "claude-profiles.yml"
+        
+        manager = ClaudeEnvManager(str(config_file))
+        manager.save_config(ProfileConfig(default_profile="test-profile"))
+        
+        assert yaml.safe_load(config_file.read_bytes()) == {
+            "profiles": [],
+            "default_profile": "test-profile",
+        }
 
-    def test_list_profiles(self):
-        """Test listing profiles."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
+    def test_save_raw_config(self, tmp_path, anthropic_env):
+        """Test that raw config data is written as given and cached as models."""
+        config_file = tmp_path / "nested" / "claude-profiles.json"
+        data = {
+            "profiles": [
+                {
+                    "name": "test-profile",
+                    "env": dict(anthropic_env),
+                    "description": "Test profile",
+                    "created": "2024-01-01T00:00:00Z",
+                    "modified": "2024-01-01T00:00:00Z"
+                }
+            ],
+            "default_profile": "test-profile"
         }
         
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile])
+        manager = ClaudeEnvManager(str(config_file))
+        manager.save_raw_config(data)
+        
+        assert json.loads(config_file.read_text()) == data
+        assert (
+            manager.load_config().get_profile("test-profile").description
+            == "Test profile"
+        )
+
+    def test_save_settings_skips_unchanged_file(self, tmp_path, make_settings):
+        """Test that saving identical settings skips the backup and write."""
+        settings = make_settings({"ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022"})
+        settings_file = tmp_path / "settings.json"
+        manager = ClaudeEnvManager(None, str(settings_file))
+        manager.save_settings(settings)
+        first_write = settings_file.stat()
+        
+        manager.save_settings(settings)
+        
+        # An atomic rewrite would replace the inode; a backup would add a file
+        assert settings_file.stat().st_ino == first_write.st_ino
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    def test_load_settings(self, tmp_path, settings_json):
+        """Test loading settings."""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(settings_json)
+        
+        manager = ClaudeEnvManager(None, str(settings_file))
+        settings = manager.load_settings()
+        
+        assert settings.env["ANTHROPIC_BASE_URL"] == "https://api.anthropic.com"
+        assert manager._settings_cache == settings
+
+    def test_load_settings_nonexistent_file(self, tmp_path):
+        """Test loading settings when file doesn't exist."""
+        manager = ClaudeEnvManager(None, str(tmp_path / "settings.json"))
+        
+        with pytest.raises(SettingsFileError, match="Settings file not found"):
+            manager.load_settings()
+
+    def test_list_profiles(self, manager, sample_profile):
+        """Test listing profiles."""
+        config = ProfileConfig(profiles=[sample_profile])
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
         profiles = manager.list_profiles()
@@ -191,147 +254,108 @@ class TestClaudeEnvManager:
         assert len(profiles) == 1
         assert profiles[0].name == "test-profile"
 
-    def test_get_profile_existing(self):
+    def test_get_profile_existing(self, manager, sample_profile):
         """Test getting existing profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile])
+        config = ProfileConfig(profiles=[sample_profile])
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
         retrieved = manager.get_profile("test-profile")
         
-        assert retrieved == profile
+        assert retrieved == sample_profile
 
-    def test_get_profile_nonexistent(self):
+    def test_get_profile_nonexistent(self, manager):
         """Test getting non-existent profile."""
-        manager = ClaudeEnvManager()
         manager._config_cache = ProfileConfig()
         
-        with pytest.raises(ProfileNotFoundError, match="Profile 'non-existent' not found"):
+        with pytest.raises(ProfileNotFoundError) as excinfo:
             manager.get_profile("non-existent")
+        assert excinfo.value.args[0] == _NOT_FOUND_MSG
 
-    def test_create_profile_success(self):
+    def test_create_profile_success(self, manager, anthropic_env, monkeypatch):
         """Test creating profile successfully."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
         config = ProfileConfig()
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
-        with patch.object(manager, 'save_config') as mock_save:
-            profile = manager.create_profile("test-profile", env_vars, "Test description")
-            
-            assert profile.name == "test-profile"
-            assert profile.env == env_vars
-            assert profile.description == "Test description"
-            mock_save.assert_called_once()
+        saved = []
+        monkeypatch.setattr(manager, "save_config", saved.append)
+        
+        profile = manager.create_profile(
+            "test-profile", dict(anthropic_env), "Test description"
+        )
+        
+        assert profile.name == "test-profile"
+        assert profile.env == anthropic_env
+        assert profile.description == "Test description"
+        assert saved == [config]
 
-    def test_create_profile_already_exists(self):
+    def test_create_profile_already_exists(
+        self, manager, anthropic_env, sample_profile
+    ):
         """Test creating profile that already exists."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        config = ProfileConfig(profiles=[sample_profile])
         
-        existing_profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[existing_profile])
-        
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
-        with pytest.raises(ProfileExistsError, match="Profile 'test-profile' already exists"):
-            manager.create_profile("test-profile", env_vars)
+        with pytest.raises(ProfileExistsError) as excinfo:
+            manager.create_profile("test-profile", dict(anthropic_env))
+        assert excinfo.value.args[0] == _EXISTS_MSG
 
-    def test_update_profile_success(self):
+    def test_update_profile_success(self, manager, sample_profile, monkeypatch):
         """Test updating profile successfully."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile])
+        config = ProfileConfig(profiles=[sample_profile])
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
         new_env_vars = {"ANTHROPIC_MODEL": "claude-3-opus-20240229"}
         
-        with patch.object(manager, 'save_config') as mock_save:
-            updated = manager.update_profile("test-profile", new_env_vars, "Updated description")
-            
-            assert updated.env["ANTHROPIC_MODEL"] == "claude-3-opus-20240229"
-            assert updated.description == "Updated description"
-            mock_save.assert_called_once()
+        saved = []
+        monkeypatch.setattr(manager, "save_config", saved.append)
+        
+        updated = manager.update_profile(
+            "test-profile", new_env_vars, "Updated description"
+        )
+        
+        assert updated.env["ANTHROPIC_MODEL"] == "claude-3-opus-20240229"
+        assert updated.description == "Updated description"
+        assert saved == [config]
 
-    def test_update_profile_nonexistent(self):
+    def test_update_profile_nonexistent(self, manager):
         """Test updating non-existent profile."""
-        manager = ClaudeEnvManager()
         manager._config_cache = ProfileConfig()
         
-        with pytest.raises(ProfileNotFoundError, match="Profile 'non-existent' not found"):
+        with pytest.raises(ProfileNotFoundError) as excinfo:
             manager.update_profile("non-existent", {"ANTHROPIC_MODEL": "new-model"})
+        assert excinfo.value.args[0] == _NOT_FOUND_MSG
 
-    def test_delete_profile_success(self):
+    def test_delete_profile_success(self, manager, sample_profile, monkeypatch):
         """Test deleting profile successfully."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile], default_profile="test-profile")
+        config = ProfileConfig(
+            profiles=[sample_profile], default_profile="test-profile"
+        )
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
-        with patch.object(manager, 'save_config') as mock_save:
-            result = manager.delete_profile("test-profile")
-            
-            assert result is True
-            mock_save.assert_called_once()
+        saved = []
+        monkeypatch.setattr(manager, "save_config", saved.append)
+        
+        result = manager.delete_profile("test-profile")
+        
+        assert result is True
+        assert saved == [config]
 
-    def test_delete_profile_nonexistent(self):
+    def test_delete_profile_nonexistent(self, manager):
         """Test deleting non-existent profile."""
-        manager = ClaudeEnvManager()
         manager._config_cache = ProfileConfig()
         
-        with pytest.raises(ProfileNotFoundError, match="Profile 'non-existent' not found"):
+        with pytest.raises(ProfileNotFoundError) as excinfo:
             manager.delete_profile("non-existent")
+        assert excinfo.value.args[0] == _NOT_FOUND_MSG
 
-    @patch('claude_env_manager.api.create_backup')
-    @patch('claude_env_manager.api.safe_write_file')
-    def test_apply_profile_success(self, mock_write_file, mock_backup):
+    def test_apply_profile_success(self, manager, sample_profile, make_settings):
         """Test applying profile successfully."""
         # Setup profile
-        profile_env = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=profile_env)
-        config = ProfileConfig(profiles=[profile])
+        config = ProfileConfig(profiles=[sample_profile])
         
         # Setup settings
         settings_env = {
@@ -342,220 +366,173 @@ class TestClaudeEnvManager:
             "OTHER_VAR": "other_value"
         }
         
-        settings = ClaudeSettings(
-            env=settings_env,
-            permissions={"allow": [], "deny": []},
-            status_line={"type": "command", "command": "/path/to/ccline", "padding": 0}
-        )
+        settings = make_settings(settings_env)
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         manager._settings_cache = settings
         
         result = manager.apply_profile("test-profile")
         
         assert result is True
-        # Check that non-Anthropic variables are preserved
-        assert settings.env["OTHER_VAR"] == "other_value"
-        # Check that Anthropic variables are updated
-        assert settings.env["ANTHROPIC_MODEL"] == "claude-3-5-sonnet-20241022"
-
-    def test_get_current_profile(self):
-        """Test getting current profile."""
-        # Setup profile
-        profile_env = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
+        # Anthropic variables come from the profile; others are preserved and
+        # API_TIMEOUT_MS gets its default
+        expected_env = {
+            "API_TIMEOUT_MS": "600000",
+            **sample_profile.env,
+            "OTHER_VAR": "other_value",
         }
+        assert settings.env == expected_env
+        # Check that the settings were written to disk
+        written = json.loads(manager.settings_file.read_text())
+        assert written["env"] == expected_env
+
+    def test_apply_default_profile_skips_config_save(
+        self, manager, anthropic_env, sample_profile, make_settings, monkeypatch
+    ):
+        """Test that applying the current default profile does not resave the config."""
+        settings = make_settings(dict(anthropic_env))
+        
+        manager._config_cache = ProfileConfig(
+            profiles=[sample_profile], default_profile="test-profile"
+        )
+        manager._settings_cache = settings
         
-        profile = EnvironmentProfile(name="test-profile", env=profile_env)
-        config = ProfileConfig(profiles=[profile])
+        saved = []
+        monkeypatch.setattr(manager, "save_config", saved.append)
         
-        # Setup settings with matching model
-        settings_env = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        assert manager.apply_profile("test-profile") is True
         
-        settings = ClaudeSettings(
-            env=settings_env,
-            permissions={"allow": [], "deny": []},
-            status_line={"type": "command", "command": "/path/to/ccline", "padding": 0}
+        assert saved == []
+
+    def test_apply_profile_clears_unknown_anthropic_vars(
+        self, manager, sample_profile, make_settings
+    ):
+        """Test that Anthropic variables outside the profile are cleared."""
+        settings = make_settings(
+            {"ANTHROPIC_AUTH_TOKEN": "old-token", "OTHER_VAR": "other_value"}
         )
         
-        manager = ClaudeEnvManager()
-        manager._config_cache = config
+        manager._config_cache = ProfileConfig(profiles=[sample_profile])
         manager._settings_cache = settings
         
+        manager.apply_profile("test-profile")
+        
+        assert settings.env == {
+            "API_TIMEOUT_MS": "600000",
+            **sample_profile.env,
+            "OTHER_VAR": "other_value",
+        }
+
+    def test_get_current_profile(
+        self, manager, sample_profile, anthropic_env, make_settings
+    ):
+        """Test getting current profile."""
+        # Setup profile and settings with matching model, read back from disk
+        manager.save_config(ProfileConfig(profiles=[sample_profile]))
+        manager.save_settings(make_settings(dict(anthropic_env)))
+        manager.clear_cache()
+        
         current = manager.get_current_profile()
         
         assert current == "test-profile"
 
-    def test_get_current_profile_no_match(self):
+    def test_get_current_profile_no_match(
+        self, manager, sample_profile, anthropic_env, make_settings
+    ):
         """Test getting current profile when no match found."""
-        # Setup profile
-        profile_env = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=profile_env)
-        config = ProfileConfig(profiles=[profile])
-        
-        # Setup settings with different model
-        settings_env = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-opus-20240229",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        settings = ClaudeSettings(
-            env=settings_env,
-            permissions={"allow": [], "deny": []},
-            status_line={"type": "command", "command": "/path/to/ccline", "padding": 0}
-        )
-        
-        manager = ClaudeEnvManager()
-        manager._config_cache = config
-        manager._settings_cache = settings
+        # Setup profile and settings with different model, read back from disk
+        settings_env = {**anthropic_env, "ANTHROPIC_MODEL": "claude-3-opus-20240229"}
+        manager.save_config(ProfileConfig(profiles=[sample_profile]))
+        manager.save_settings(make_settings(settings_env))
+        manager.clear_cache()
         
         current = manager.get_current_profile()
         
         assert current is None
 
-    def test_get_default_profile(self):
+    def test_get_default_profile(self, manager, sample_profile):
         """Test getting default profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars
+        config = ProfileConfig(
+            profiles=[sample_profile], default_profile="test-profile"
         )
-        config = ProfileConfig(profiles=[profile], default_profile="test-profile")
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
         default = manager.get_default_profile()
         
         assert default == "test-profile"
 
-    def test_set_default_profile(self):
+    def test_set_default_profile(self, manager, sample_profile, monkeypatch):
         """Test setting default profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars
-        )
-        config = ProfileConfig(profiles=[profile])
+        config = ProfileConfig(profiles=[sample_profile])
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
-        with patch.object(manager, 'save_config') as mock_save:
-            manager.set_default_profile("test-profile")
-            
-            assert config.default_profile == "test-profile"
-            mock_save.assert_called_once()
+        saved = []
+        monkeypatch.setattr(manager, "save_config", saved.append)
+        
+        manager.set_default_profile("test-profile")
+        
+        assert config.default_profile == "test-profile"
+        assert saved == [config]
 
-    def test_set_default_profile_nonexistent(self):
+    def test_set_default_profile_nonexistent(self, manager):
         """Test setting default profile to non-existent profile."""
-        manager = ClaudeEnvManager()
         manager._config_cache = ProfileConfig()
         
-        with pytest.raises(ProfileNotFoundError, match="Profile 'non-existent' not found"):
+        with pytest.raises(ProfileNotFoundError) as excinfo:
             manager.set_default_profile("non-existent")
+        assert excinfo.value.args[0] == _NOT_FOUND_MSG
 
-    def test_get_current_settings(self):
+    def test_get_current_settings(self, manager, anthropic_env, make_settings):
         """Test getting current settings as dictionary."""
-        settings_env = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        settings_env = dict(anthropic_env)
         
-        settings = ClaudeSettings(
-            env=settings_env,
-            permissions={"allow": [], "deny": []},
-            status_line={"type": "command", "command": "/path/to/ccline", "padding": 0}
-        )
+        settings = make_settings(settings_env)
         
-        manager = ClaudeEnvManager()
         manager._settings_cache = settings
         
         current_settings = manager.get_current_settings()
         
-        assert current_settings["env"] == settings_env
-        assert current_settings["$schema"] == "https://json.schemastore.org/claude-code-settings.json"
+        assert current_settings == {
+            "env": settings_env,
+            "permissions": {"allow": [], "deny": []},
+            "statusLine": {
+                "type": "command",
+                "command": "/path/to/ccline",
+                "padding": 0,
+            },
+            "$schema": "https://json.schemastore.org/claude-code-settings.json",
+        }
 
-    def test_get_current_settings_error(self):
+    def test_get_current_settings_error(self, manager, monkeypatch):
         """Test getting current settings when error occurs."""
-        manager = ClaudeEnvManager()
-        
-        # Mock load_settings to raise an exception
-        with patch.object(manager, 'load_settings', side_effect=SettingsFileError("Error")):
-            current_settings = manager.get_current_settings()
-            
-            assert current_settings == {}
-
-    def test_validate_profile_valid(self):
-        """Test validating valid profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        def fail():
+            raise SettingsFileError("Error")
         
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile])
+        # Replace load_settings with one that raises
+        monkeypatch.setattr(manager, "load_settings", fail)
         
-        manager = ClaudeEnvManager()
-        manager._config_cache = config
-        
-        result = manager.validate_profile("test-profile")
+        current_settings = manager.get_current_settings()
         
-        assert result is True
+        assert current_settings == {}
 
-    def test_validate_profile_invalid(self):
-        """Test validating invalid profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(name="test-profile", env=env_vars)
-        config = ProfileConfig(profiles=[profile])
+    @pytest.mark.parametrize("profile_name,expected", [
+        ("test-profile", True),
+        ("non-existent", False)
+    ])
+    def test_validate_profile(self, manager, sample_profile, profile_name, expected):
+        """Test validating existing and non-existent profiles."""
+        config = ProfileConfig(profiles=[sample_profile])
         
-        manager = ClaudeEnvManager()
         manager._config_cache = config
         
-        result = manager.validate_profile("non-existent")
+        result = manager.validate_profile(profile_name)
         
-        assert result is False
+        assert result is expected
 
-    def test_clear_cache(self):
+    def test_clear_cache(self, manager):
         """Test clearing cache."""
-        manager = ClaudeEnvManager()
         manager._config_cache = "cached_config"
         manager._settings_cache = "cached_settings"
         
@@ -566,22 +543,12 @@ class TestClaudeEnvManager:
 
     def test_get_config_path(self):
         """Test getting config file path."""
-        config_path = "/custom/config.yml"
-        manager = ClaudeEnvManager(config_path)
-        
-        # Use os.path.normpath to handle platform-specific path separators
-        import os
-        expected_config_path = os.path.normpath(config_path)
+        manager = ClaudeEnvManager(_CUSTOM_CONFIG_PATH)
         
-        assert manager.get_config_path() == expected_config_path
+        assert manager.get_config_path() == _CUSTOM_CONFIG_NORM
 
     def test_get_settings_path(self):
         """Test getting settings file path."""
-        settings_path = "/custom/settings.json"
-        manager = ClaudeEnvManager(None, settings_path)
-        
-        # Use os.path.normpath to handle platform-specific path separators
-        import os
-        expected_settings_path = os.path.normpath(settings_path)
+        manager = ClaudeEnvManager(None, _CUSTOM_SETTINGS_PATH)
         
-        assert manager.get_settings_path() == expected_settings_path
\ No newline at end of file
+        assert manager.get_settings_path() == _CUSTOM_SETTINGS_NORM
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Test cases for the TUI interface components."""
+
+from rich.prompt import Prompt
+
+from claude_env_manager.cli import interface
+
+
+class TestSelectProfileTui:
+    """Test interactive profile selection."""
+
+    def test_keyboard_interrupt_cancels_selection(
+        self, monkeypatch, manager, sample_config
+    ):
+        """Test that Ctrl-C at the prompt cancels instead of prompting again."""
+        manager.save_config(sample_config)
+        prompts = []
+
+        def interrupt(*args, **kwargs):
+            prompts.append(args)
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(Prompt, "ask", interrupt)
+
+        assert interface.select_profile_tui(manager) is None
+        assert len(prompts) == 1
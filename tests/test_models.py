@@ -1,22 +1,15 @@
 """Test cases for EnvironmentProfile data model."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from claude_env_manager.models import EnvironmentProfile
 
 
 class TestEnvironmentProfile:
     """Test EnvironmentProfile data model."""
 
-    def test_create_valid_profile(self):
+    def test_create_valid_profile(self, env_vars):
         """Test creating a valid profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
         profile = EnvironmentProfile(
             name="test-profile",
             env=env_vars,
@@ -29,73 +22,58 @@ class TestEnvironmentProfile:
         assert isinstance(profile.created, datetime)
         assert isinstance(profile.modified, datetime)
 
-    def test_profile_without_name(self):
-        """Test profile without name raises error."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        with pytest.raises(ValueError, match="Profile name is required"):
-            EnvironmentProfile(
-                name="",
-                env=env_vars
-            )
-
-    def test_profile_missing_required_vars(self):
-        """Test profile missing required environment variables."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            # Missing ANTHROPIC_MODEL and ANTHROPIC_SMALL_FAST_MODEL
-        }
-        
-        with pytest.raises(ValueError, match="Required environment variable.*is missing"):
-            EnvironmentProfile(
-                name="test-profile",
-                env=env_vars
-            )
-
-    def test_profile_invalid_api_key(self):
-        """Test profile with invalid API key format."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "invalid-key",  # Doesn't start with sk-
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        with pytest.raises(ValueError, match="API key must start with 'sk-'"):
-            EnvironmentProfile(
-                name="test-profile",
-                env=env_vars
-            )
-
-    def test_profile_invalid_base_url(self):
-        """Test profile with invalid base URL."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "invalid-url",  # Not HTTP/HTTPS
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        with pytest.raises(ValueError, match="Base URL must start with 'http://' or 'https://'"):
+    @pytest.mark.parametrize("name,overrides,match", [
+        pytest.param("", {}, "Profile name is required", id="without-name"),
+        pytest.param(
+            "test-profile",
+            {"ANTHROPIC_MODEL": None, "ANTHROPIC_SMALL_FAST_MODEL": None},
+            "Required environment variable.*is missing",
+            id="missing-required-vars"
+        ),
+        pytest.param(
+            "test-profile",
+            {"ANTHROPIC_API_KEY": "invalid-key"},  # Doesn't start with sk-
+            "API key must start with 'sk-'",
+            id="invalid-api-key"
+        ),
+        pytest.param(
+            "test-profile",
+            {"ANTHROPIC_BASE_URL": "invalid-url"},  # Not HTTP/HTTPS
+            "Base URL must start with 'http://' or 'https://'",
+            id="invalid-base-url"
+        ),
+        pytest.param(
+            "test-profile",
+            {"ANTHROPIC_MODEL": "invalid model@name"},  # Contains invalid character @
+            "Invalid model name format",
+            id="invalid-model-name-format"
+        ),
+    ])
+    def test_profile_invalid_field(self, env_vars, name, overrides, match):
+        """Test that an invalid name or env variable raises error."""
+        # A None override removes the variable
+        for key, value in overrides.items():
+            if value is None:
+                del env_vars[key]
+            else:
+                env_vars[key] = value
+        
+        with pytest.raises(ValueError, match=match):
             EnvironmentProfile(
-                name="test-profile",
+                name=name,
                 env=env_vars
             )
 
-    def test_profile_any_base_url_accepted(self):
-        """Test that any valid base URL is accepted."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://any-domain.com/api",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+    @pytest.mark.parametrize("overrides", [
+        pytest.param({"ANTHROPIC_BASE_URL": "https://any-domain.com/api"}, id="any-base-url"),
+        pytest.param(
+            {"ANTHROPIC_MODEL": "zai-org/GLM-4.5", "ANTHROPIC_SMALL_FAST_MODEL": "gpt-4"},
+            id="any-model-name"
+        ),
+    ])
+    def test_profile_any_value_accepted(self, env_vars, overrides):
+        """Test that any valid base URL and model name format is accepted."""
+        env_vars.update(overrides)
         
         # This should not raise an error
         profile = EnvironmentProfile(
@@ -103,50 +81,27 @@ class TestEnvironmentProfile:
             env=env_vars
         )
         
-        assert profile.env["ANTHROPIC_BASE_URL"] == "https://any-domain.com/api"
+        assert profile.env.items() >= overrides.items()
 
-    def test_profile_any_model_name_accepted(self):
-        """Test that any model name format is accepted."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "zai-org/GLM-4.5",
-            "ANTHROPIC_SMALL_FAST_MODEL": "gpt-4"
-        }
-        
-        # This should not raise an error
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars
-        )
+    def test_validate_after_update(self, env_vars):
+        """Test that validate() rechecks a profile changed after construction."""
+        profile = EnvironmentProfile(name="test-profile", env=env_vars)
+        profile.validate()
         
-        assert profile.env["ANTHROPIC_MODEL"] == "zai-org/GLM-4.5"
-        assert profile.env["ANTHROPIC_SMALL_FAST_MODEL"] == "gpt-4"
+        profile.update_env({"ANTHROPIC_API_KEY": "invalid-key"})
+        with pytest.raises(ValueError, match="API key must start with 'sk-'"):
+            profile.validate()
 
-    def test_profile_invalid_model_name_format(self):
-        """Test profile with invalid model name format."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "invalid model@name",  # Contains invalid character @
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+    def test_has_valid_api_key_follows_env(self, env_vars):
+        """Test that the API key check reflects the current env."""
+        profile = EnvironmentProfile(name="test-profile", env=env_vars)
+        assert profile.has_valid_api_key is True
         
-        with pytest.raises(ValueError, match="Invalid model name format"):
-            EnvironmentProfile(
-                name="test-profile",
-                env=env_vars
-            )
+        profile.update_env({"ANTHROPIC_API_KEY": "invalid-key"})
+        assert profile.has_valid_api_key is False
 
-    def test_profile_to_dict(self):
+    def test_profile_to_dict(self, env_vars):
         """Test converting profile to dictionary."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
         profile = EnvironmentProfile(
             name="test-profile",
             env=env_vars,
@@ -161,16 +116,11 @@ class TestEnvironmentProfile:
         assert "created" in data
         assert "modified" in data
 
-    def test_profile_from_dict(self):
+    def test_profile_from_dict(self, anthropic_env):
         """Test creating profile from dictionary."""
         data = {
             "name": "test-profile",
-            "env": {
-                "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-            },
+            "env": dict(anthropic_env),
             "description": "Test profile",
             "created": "2024-01-01T00:00:00",
             "modified": "2024-01-01T00:00:00"
@@ -184,22 +134,59 @@ class TestEnvironmentProfile:
         assert isinstance(profile.created, datetime)
         assert isinstance(profile.modified, datetime)
 
-    def test_update_env(self):
-        """Test updating environment variables."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
+    @pytest.mark.parametrize("overrides,description", [
+        pytest.param({}, None, id="defaults"),
+        pytest.param({}, "Test profile", id="description"),
+        pytest.param({}, "", id="empty-description"),
+        pytest.param(
+            {"ANTHROPIC_MODEL": "zai-org/GLM-4.5", "ANTHROPIC_SMALL_FAST_MODEL": "gpt-4"},
+            "Vendor models",
+            id="vendor-models"
+        ),
+        pytest.param(
+            {"ANTHROPIC_BASE_URL": "http://localhost:8080/v1", "API_TIMEOUT_MS": "600000"},
+            "Local proxy with extra var",
+            id="extra-var"
+        ),
+        pytest.param({}, "Ünïcode déscription ✓", id="unicode-description"),
+    ])
+    def test_profile_round_trip(self, env_vars, overrides, description):
+        """Test that from_dict(to_dict()) reproduces the profile."""
+        env_vars.update(overrides)
+        profile = EnvironmentProfile(
+            name="test-profile",
+            env=env_vars,
+            description=description,
+            created=datetime(2024, 1, 1, 12, 30, 15, 123456)
+        )
+        
+        assert EnvironmentProfile.from_dict(profile.to_dict()) == profile
+
+    def test_profile_from_dict_accepts_datetimes(self, anthropic_env):
+        """Test that already-parsed timestamps are kept as-is."""
+        timestamp = datetime(2024, 1, 1, 12, 30)
+        data = {
+            "name": "test-profile",
+            "env": dict(anthropic_env),
+            "created": timestamp,
+            "modified": timestamp
         }
         
+        profile = EnvironmentProfile.from_dict(data)
+        
+        assert profile.created == timestamp
+        assert profile.modified == timestamp
+        assert profile.description is None
+
+    def test_update_env(self, env_vars, fake_clock):
+        """Test updating environment variables."""
         profile = EnvironmentProfile(
             name="test-profile",
-            env=env_vars
+            env=env_vars,
+            created=fake_clock,
+            modified=fake_clock
         )
         
-        original_modified = profile.modified
-        
         new_vars = {
             "ANTHROPIC_MODEL": "claude-3-opus-20240229",
             "NEW_VAR": "new-value"
@@ -210,4 +197,24 @@ class TestEnvironmentProfile:
         assert profile.env["ANTHROPIC_MODEL"] == "claude-3-opus-20240229"
         assert profile.env["NEW_VAR"] == "new-value"
         assert profile.env["ANTHROPIC_API_KEY"] == "sk-ant-api03-test"  # Unchanged
-        assert profile.modified > original_modified
\ No newline at end of file
+        assert profile.modified == fake_clock + timedelta(seconds=1)
+        
+    def test_update_env_advances_future_timestamp(self, env_vars):
+        """Test that modified keeps increasing even if it is ahead of the clock."""
+        future = datetime.now() + timedelta(days=1)
+        
+        profile = EnvironmentProfile(
+            name="test-profile",
+            env=env_vars,
+            modified=future
+        )
+        
+        profile.update_env({"NEW_VAR": "first"})
+        first = profile.modified
+        profile.update_env({"NEW_VAR": "second"})
+        
+        assert future < first < profile.modified
+
+    def test_profile_is_slotted(self, make_profile):
+        """Test that profiles use slots instead of a per-instance __dict__."""
+        assert not hasattr(make_profile(), "__dict__")
\ No newline at end of file
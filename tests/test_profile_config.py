@@ -4,6 +4,13 @@ import pytest
 from claude_env_manager.models import EnvironmentProfile, ProfileConfig
 
 
+class _NoScanList(list):
+    """Profile list that fails the test if anything iterates over it."""
+
+    def __iter__(self):
+        raise AssertionError("profiles were scanned")
+
+
 class TestProfileConfig:
     """Test ProfileConfig data model."""
 
@@ -14,20 +21,9 @@ class TestProfileConfig:
         assert config.profiles == []
         assert config.default_profile is None
 
-    def test_create_config_with_profiles(self):
+    def test_create_config_with_profiles(self, make_profile):
         """Test creating config with profiles."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
+        profile = make_profile()
         
         config = ProfileConfig(
             profiles=[profile],
@@ -38,45 +34,39 @@ class TestProfileConfig:
         assert config.profiles[0] == profile
         assert config.default_profile == "test-profile"
 
-    def test_config_to_dict(self):
+    def test_config_to_dict(self, sample_config):
         """Test converting config to dictionary."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        data = sample_config.to_dict()
         
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
+        assert "profiles" in data
+        assert len(data["profiles"]) == 1
+        assert data["profiles"][0]["name"] == "test-profile"
+        assert data["default_profile"] == "test-profile"
+
+    def test_config_yaml_round_trip(self, env_vars):
+        """Test that to_dict output survives the safe YAML dumper and loader."""
+        # Imported here so the rest of the module never pays the PyYAML import cost
+        import yaml
         
         config = ProfileConfig(
-            profiles=[profile],
+            profiles=[EnvironmentProfile(name="test-profile", env=env_vars)],
             default_profile="test-profile"
         )
         
-        data = config.to_dict()
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        text = yaml.dump(config.to_dict(), Dumper=dumper)
+        restored = ProfileConfig.from_dict(yaml.load(text, Loader=loader))
         
-        assert "profiles" in data
-        assert len(data["profiles"]) == 1
-        assert data["profiles"][0]["name"] == "test-profile"
-        assert data["default_profile"] == "test-profile"
+        assert restored == config
 
-    def test_config_from_dict(self):
+    def test_config_from_dict(self, anthropic_env):
         """Test creating config from dictionary."""
         data = {
             "profiles": [
                 {
                     "name": "test-profile",
-                    "env": {
-                        "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                        "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                        "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                        "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-                    },
+                    "env": dict(anthropic_env),
                     "description": "Test profile",
                     "created": "2024-01-01T00:00:00",
                     "modified": "2024-01-01T00:00:00"
@@ -91,6 +81,21 @@ class TestProfileConfig:
         assert config.profiles[0].name == "test-profile"
         assert config.default_profile == "test-profile"
 
+    @pytest.mark.parametrize("count,default_profile", [
+        pytest.param(0, None, id="empty"),
+        pytest.param(1, "profile-0", id="single"),
+        pytest.param(5, "profile-3", id="several"),
+        pytest.param(3, None, id="no-default"),
+    ])
+    def test_config_round_trip(self, make_profile, count, default_profile):
+        """Test that from_dict(to_dict()) reproduces the config."""
+        config = ProfileConfig(
+            profiles=[make_profile(name=f"profile-{i}") for i in range(count)],
+            default_profile=default_profile
+        )
+        
+        assert ProfileConfig.from_dict(config.to_dict()) == config
+
     def test_config_from_dict_without_profiles(self):
         """Test creating config from dictionary without profiles."""
         data = {
@@ -102,18 +107,13 @@ class TestProfileConfig:
         assert config.profiles == []
         assert config.default_profile == "test-profile"
 
-    def test_config_from_dict_without_default(self):
+    def test_config_from_dict_without_default(self, anthropic_env):
         """Test creating config from dictionary without default profile."""
         data = {
             "profiles": [
                 {
                     "name": "test-profile",
-                    "env": {
-                        "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                        "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                        "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                        "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-                    },
+                    "env": dict(anthropic_env),
                     "description": "Test profile",
                     "created": "2024-01-01T00:00:00",
                     "modified": "2024-01-01T00:00:00"
@@ -126,45 +126,19 @@ class TestProfileConfig:
         assert len(config.profiles) == 1
         assert config.default_profile is None
 
-    def test_get_profile(self):
+    def test_get_profile(self, sample_config):
         """Test getting profile by name."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
-        
-        config = ProfileConfig(profiles=[profile])
-        
         # Test existing profile
-        found = config.get_profile("test-profile")
-        assert found == profile
+        found = sample_config.get_profile("test-profile")
+        assert found is sample_config.profiles[0]
         
         # Test non-existing profile
-        not_found = config.get_profile("non-existent")
+        not_found = sample_config.get_profile("non-existent")
         assert not_found is None
 
-    def test_add_profile(self):
+    def test_add_profile(self, make_profile):
         """Test adding profile to config."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
+        profile = make_profile()
         
         config = ProfileConfig()
         config.add_profile(profile)
@@ -172,52 +146,22 @@ class TestProfileConfig:
         assert len(config.profiles) == 1
         assert config.profiles[0] == profile
 
-    def test_add_duplicate_profile(self):
+    def test_add_duplicate_profile(self, make_profile):
         """Test adding duplicate profile raises error."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        profile1 = make_profile()
         
-        profile1 = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
-        
-        profile2 = EnvironmentProfile(
-            name="test-profile",  # Same name
-            env=env_vars,
-            description="Another test profile"
-        )
+        profile2 = make_profile(description="Another test profile")  # Same name
         
         config = ProfileConfig()
         config.add_profile(profile1)
         
-        with pytest.raises(ValueError, match="Profile 'test-profile' already exists"):
+        with pytest.raises(ValueError) as excinfo:
             config.add_profile(profile2)
+        assert excinfo.value.args[0] == "Profile 'test-profile' already exists"
 
-    def test_remove_profile(self):
+    def test_remove_profile(self, sample_config):
         """Test removing profile from config."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
-        
-        config = ProfileConfig(
-            profiles=[profile],
-            default_profile="test-profile"
-        )
+        config = sample_config
         
         # Remove existing profile
         removed = config.remove_profile("test-profile")
@@ -225,6 +169,38 @@ class TestProfileConfig:
         assert len(config.profiles) == 0
         assert config.default_profile is None  # Default cleared
 
+    def test_get_profile_tracks_add_and_remove(self, make_profile):
+        """Test that name lookups follow profiles being added and removed."""
+        profile = make_profile()
+        config = ProfileConfig()
+        
+        config.add_profile(profile)
+        assert config.get_profile("test-profile") is profile
+        
+        config.remove_profile("test-profile")
+        assert config.get_profile("test-profile") is None
+
+    def test_get_profile_does_not_scan_profiles(self, make_profile):
+        """Test that name lookups use the index, not a scan of the profile list."""
+        config = ProfileConfig(
+            profiles=[make_profile(name=f"profile-{i}") for i in range(1000)]
+        )
+        # Any iteration over the list from here on fails the test
+        config.profiles = _NoScanList(config.profiles)
+        
+        assert config.get_profile("profile-999").name == "profile-999"
+        assert config.get_profile("non-existent") is None
+
+    def test_find_by_model_tracks_updates(self, make_profile):
+        """Test that model lookups follow env updates."""
+        profile = make_profile()
+        config = ProfileConfig(profiles=[profile])
+        assert config.find_by_model("claude-3-5-sonnet-20241022") is profile
+        
+        config.update_profile("test-profile", env={"ANTHROPIC_MODEL": "claude-3-opus-20240229"})
+        assert config.find_by_model("claude-3-5-sonnet-20241022") is None
+        assert config.find_by_model("claude-3-opus-20240229") is profile
+
     def test_remove_nonexistent_profile(self):
         """Test removing non-existent profile."""
         config = ProfileConfig()
@@ -232,24 +208,14 @@ class TestProfileConfig:
         removed = config.remove_profile("non-existent")
         assert removed is False
 
-    def test_remove_default_profile_with_others(self):
+    def test_remove_default_profile_with_others(self, make_profile, anthropic_env):
         """Test removing default profile when other profiles exist."""
-        env_vars1 = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test-1",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        env_vars1 = {**anthropic_env, "ANTHROPIC_API_KEY": "sk-ant-api03-test-1"}
         
-        env_vars2 = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test-2",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
+        env_vars2 = {**anthropic_env, "ANTHROPIC_API_KEY": "sk-ant-api03-test-2"}
         
-        profile1 = EnvironmentProfile(name="profile1", env=env_vars1)
-        profile2 = EnvironmentProfile(name="profile2", env=env_vars2)
+        profile1 = make_profile(name="profile1", env=env_vars1)
+        profile2 = make_profile(name="profile2", env=env_vars2)
         
         config = ProfileConfig(
             profiles=[profile1, profile2],
@@ -262,22 +228,30 @@ class TestProfileConfig:
         assert len(config.profiles) == 1
         assert config.default_profile == "profile2"  # Default set to remaining profile
 
-    def test_update_profile(self):
-        """Test updating profile."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
+    def test_remove_profile_with_duplicate_name(self, make_profile):
+        """Test that a loaded duplicate stays reachable after the first is removed."""
+        data = {
+            "profiles": [
+                make_profile(description="first").to_dict(),
+                make_profile(description="second").to_dict(),
+            ],
+            "default_profile": "test-profile",
         }
+        config = ProfileConfig.from_dict(data)
         
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
+        assert config.remove_profile("test-profile") is True
+        assert config.get_profile("test-profile").description == "second"
         
-        config = ProfileConfig(profiles=[profile])
+        with pytest.raises(ValueError):
+            config.add_profile(make_profile(description="third"))
+        
+        assert config.remove_profile("test-profile") is True
+        assert config.get_profile("test-profile") is None
+        assert config.profiles == []
+
+    def test_update_profile(self, sample_config):
+        """Test updating profile."""
+        config = sample_config
         
         # Update environment variables
         new_env_vars = {
@@ -292,22 +266,9 @@ class TestProfileConfig:
         assert updated.env["NEW_VAR"] == "new-value"
         assert updated.env["ANTHROPIC_API_KEY"] == "sk-ant-api03-test"  # Unchanged
 
-    def test_update_profile_description(self):
+    def test_update_profile_description(self, sample_config):
         """Test updating profile description."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
-        
-        config = ProfileConfig(profiles=[profile])
+        config = sample_config
         
         # Update description
         updated = config.update_profile("test-profile", description="Updated description")
@@ -322,25 +283,16 @@ class TestProfileConfig:
         updated = config.update_profile("non-existent", description="New description")
         assert updated is None
 
-    def test_update_profile_no_changes(self):
+    def test_update_profile_no_changes(self, sample_config):
         """Test updating profile with no changes."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        profile = EnvironmentProfile(
-            name="test-profile",
-            env=env_vars,
-            description="Test profile"
-        )
-        
-        config = ProfileConfig(profiles=[profile])
+        config = sample_config
         
         # Update with no changes
         updated = config.update_profile("test-profile")
         
         assert updated is not None
-        assert updated.description == "Test profile"  # Unchanged
\ No newline at end of file
+        assert updated.description == "Test profile"  # Unchanged
+
+    def test_config_is_slotted(self):
+        """Test that configs use slots instead of a per-instance __dict__."""
+        assert not hasattr(ProfileConfig(), "__dict__")
\ No newline at end of file
@@ -3,29 +3,20 @@
 import pytest
 from claude_env_manager.models import ClaudeSettings
 
+_SCHEMA_URL = "https://json.schemastore.org/claude-code-settings.json"
+
 
 class TestClaudeSettings:
     """Test ClaudeSettings data model."""
 
-    def test_create_valid_settings(self):
+    def test_create_valid_settings(self, env_vars, base_status_line):
         """Test creating valid settings."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
         permissions = {
             "allow": ["file:read"],
             "deny": ["network:write"]
         }
         
-        status_line = {
-            "type": "command",
-            "command": "/path/to/ccline",
-            "padding": 0
-        }
+        status_line = dict(base_status_line)
         
         settings = ClaudeSettings(
             env=env_vars,
@@ -36,96 +27,43 @@ class TestClaudeSettings:
         assert settings.env == env_vars
         assert settings.permissions == permissions
         assert settings.status_line == status_line
-        assert settings.schema == "https://json.schemastore.org/claude-code-settings.json"
+        assert settings.schema == _SCHEMA_URL
 
-    def test_settings_without_env(self):
-        """Test settings without environment variables raises error."""
-        permissions = {
-            "allow": [],
-            "deny": []
-        }
-        
-        status_line = {
-            "type": "command",
-            "command": "/path/to/ccline",
-            "padding": 0
-        }
-        
-        with pytest.raises(ValueError, match="Environment variables are required"):
-            ClaudeSettings(
-                env={},
-                permissions=permissions,
-                status_line=status_line
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        pytest.param("env", {}, "Environment variables are required", id="without-env"),
+        pytest.param(
+            "permissions",
+            {},
+            "Permissions dictionary must contain.*allow.*deny",
+            id="without-permissions"
+        ),
+        pytest.param(
+            "status_line",
+            {"command": "/path/to/ccline", "padding": 0},  # Missing "type"
+            "Status line must have a 'type' field",
+            id="without-status-line-type"
+        ),
+    ])
+    def test_settings_invalid_field(self, env_vars, base_permissions, base_status_line, field, value, match):
+        """Test that an empty or incomplete settings field raises error."""
+        kwargs = {
+            "env": env_vars,
+            "permissions": dict(base_permissions),
+            "status_line": dict(base_status_line)
+        }
+        kwargs[field] = value
+        
+        with pytest.raises(ValueError, match=match):
+            ClaudeSettings(**kwargs)
 
-    def test_settings_without_permissions(self):
-        """Test settings without permissions raises error."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        status_line = {
-            "type": "command",
-            "command": "/path/to/ccline",
-            "padding": 0
-        }
-        
-        with pytest.raises(ValueError, match="Permissions dictionary must contain.*allow.*deny"):
-            ClaudeSettings(
-                env=env_vars,
-                permissions={},
-                status_line=status_line
-            )
-
-    def test_settings_without_status_line_type(self):
-        """Test settings without status line type raises error."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
-        permissions = {
-            "allow": [],
-            "deny": []
-        }
-        
-        status_line = {
-            "command": "/path/to/ccline",
-            "padding": 0
-            # Missing "type"
-        }
-        
-        with pytest.raises(ValueError, match="Status line must have a 'type' field"):
-            ClaudeSettings(
-                env=env_vars,
-                permissions=permissions,
-                status_line=status_line
-            )
-
-    def test_settings_to_dict(self):
+    def test_settings_to_dict(self, env_vars, base_status_line):
         """Test converting settings to dictionary."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
         permissions = {
             "allow": ["file:read"],
             "deny": ["network:write"]
         }
         
-        status_line = {
-            "type": "command",
-            "command": "/path/to/ccline",
-            "padding": 0
-        }
+        status_line = dict(base_status_line)
         
         settings = ClaudeSettings(
             env=env_vars,
@@ -138,27 +76,18 @@ class TestClaudeSettings:
         assert data["env"] == env_vars
         assert data["permissions"] == permissions
         assert data["statusLine"] == status_line
-        assert data["$schema"] == "https://json.schemastore.org/claude-code-settings.json"
+        assert data["$schema"] == _SCHEMA_URL
 
-    def test_settings_from_dict(self):
+    def test_settings_from_dict(self, anthropic_env, base_status_line):
         """Test creating settings from dictionary."""
         data = {
-            "env": {
-                "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-            },
+            "env": dict(anthropic_env),
             "permissions": {
                 "allow": ["file:read"],
                 "deny": ["network:write"]
             },
-            "statusLine": {
-                "type": "command",
-                "command": "/path/to/ccline",
-                "padding": 0
-            },
-            "$schema": "https://json.schemastore.org/claude-code-settings.json"
+            "statusLine": dict(base_status_line),
+            "$schema": _SCHEMA_URL
         }
         
         settings = ClaudeSettings.from_dict(data)
@@ -168,44 +97,48 @@ class TestClaudeSettings:
         assert settings.status_line == data["statusLine"]
         assert settings.schema == data["$schema"]
 
-    def test_settings_from_dict_with_schema_field(self):
+    @pytest.mark.parametrize("permissions,status_line", [
+        pytest.param({"allow": [], "deny": []}, {"type": "command"}, id="minimal"),
+        pytest.param(
+            {"allow": ["file:read"], "deny": ["network:write"]},
+            {"type": "command", "command": "/path/to/ccline", "padding": 0},
+            id="populated"
+        ),
+        pytest.param(
+            {"allow": ["Bash(git *)", "Read"], "deny": [], "ask": ["Write"]},
+            {"type": "static", "text": "✓ ready", "padding": 2},
+            id="extra-keys"
+        ),
+    ])
+    def test_settings_round_trip(self, env_vars, permissions, status_line):
+        """Test that from_dict(to_dict()) reproduces the settings."""
+        settings = ClaudeSettings(
+            env=env_vars,
+            permissions=permissions,
+            status_line=status_line
+        )
+        
+        assert ClaudeSettings.from_dict(settings.to_dict()) == settings
+
+    def test_settings_from_dict_with_schema_field(self, anthropic_env, base_permissions, base_status_line):
         """Test creating settings from dictionary with schema field."""
         data = {
-            "env": {
-                "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-                "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-                "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-            },
-            "permissions": {
-                "allow": [],
-                "deny": []
-            },
-            "statusLine": {
-                "type": "command",
-                "command": "/path/to/ccline",
-                "padding": 0
-            },
-            "$schema": "https://json.schemastore.org/claude-code-settings.json"
+            "env": dict(anthropic_env),
+            "permissions": dict(base_permissions),
+            "statusLine": dict(base_status_line),
+            "$schema": _SCHEMA_URL
         }
         
         settings = ClaudeSettings.from_dict(data)
         
         assert settings.schema == data["$schema"]
 
-    def test_update_env(self):
+    def test_update_env(self, env_vars, base_permissions, base_status_line):
         """Test updating environment variables."""
-        env_vars = {
-            "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-            "ANTHROPIC_API_KEY": "sk-ant-api03-test",
-            "ANTHROPIC_MODEL": "claude-3-5-sonnet-20241022",
-            "ANTHROPIC_SMALL_FAST_MODEL": "claude-3-haiku-20240307"
-        }
-        
         settings = ClaudeSettings(
             env=env_vars,
-            permissions={"allow": [], "deny": []},
-            status_line={"type": "command", "command": "/path/to/ccline", "padding": 0}
+            permissions=dict(base_permissions),
+            status_line=dict(base_status_line)
         )
         
         new_vars = {
@@ -217,4 +150,8 @@ class TestClaudeSettings:
         
         assert settings.env["ANTHROPIC_MODEL"] == "claude-3-opus-20240229"
         assert settings.env["NEW_VAR"] == "new-value"
-        assert settings.env["ANTHROPIC_API_KEY"] == "sk-ant-api03-test"  # Unchanged
\ No newline at end of file
+        assert settings.env["ANTHROPIC_API_KEY"] == "sk-ant-api03-test"  # Unchanged
+
+    def test_settings_is_slotted(self, make_settings, env_vars):
+        """Test that settings use slots instead of a per-instance __dict__."""
+        assert not hasattr(make_settings(env_vars), "__dict__")
\ No newline at end of file